@@ -4,46 +4,72 @@ from ninja_extra.permissions import BasePermission
 from .exceptions import AuthenticationException, PermissionException
 
 
+# ==================== 判定函数 ====================
+# 权限类与 ensure_* 共用的纯函数，兼容 user 为 None 的调用
+
+
+def _is_authenticated(user) -> bool:
+    return bool(user and getattr(user, "is_authenticated", False))
+
+
+def _is_staff_or_superuser(user) -> bool:
+    return _is_authenticated(user) and bool(user.is_staff or user.is_superuser)
+
+
+def _is_superuser(user) -> bool:
+    return _is_authenticated(user) and bool(user.is_superuser)
+
+
+# ==================== 权限类 ====================
+
+
 class IsAuthenticated(BasePermission):
     """必须已登录"""
 
     def has_permission(self, request, controller) -> bool:
-        return bool(getattr(request, "user", None) and request.user.is_authenticated)
+        return _is_authenticated(request.user)
 
 
 class IsStaffOrSuperuser(BasePermission):
     """必须是 staff 或 superuser"""
 
     def has_permission(self, request, controller) -> bool:
-        user = getattr(request, "user", None)
-        return bool(user and user.is_authenticated and (user.is_staff or user.is_superuser))
+        return _is_staff_or_superuser(request.user)
 
 
 class IsSuperuser(BasePermission):
     """必须是超级管理员"""
 
     def has_permission(self, request, controller) -> bool:
-        user = getattr(request, "user", None)
-        return bool(user and user.is_authenticated and user.is_superuser)
+        return _is_superuser(request.user)
+
+
+# 无状态权限的共享实例：ninja-extra 对传入的类会在每次请求时实例化，传实例则直接复用
+IS_AUTHENTICATED = IsAuthenticated()
+IS_STAFF_OR_SUPERUSER = IsStaffOrSuperuser()
+IS_SUPERUSER = IsSuperuser()
+
+
+# ==================== 服务层校验 ====================
 
 
 def ensure_authenticated(user):
     """确保用户已登录，否则抛 AuthenticationException。"""
-    if not user or not getattr(user, "is_authenticated", False):
+    if not _is_authenticated(user):
         raise AuthenticationException("需要登录访问")
 
 
 def ensure_staff_or_superuser(user):
     """确保用户为 staff 或 superuser，否则抛 PermissionException。"""
-    ensure_authenticated(user)
-    if not (user.is_staff or user.is_superuser):
+    if not _is_staff_or_superuser(user):
+        ensure_authenticated(user)
         raise PermissionException("需要管理员权限")
 
 
 def ensure_superuser(user):
     """确保用户为超级管理员，否则抛 PermissionException。"""
-    ensure_authenticated(user)
-    if not user.is_superuser:
+    if not _is_superuser(user):
+        ensure_authenticated(user)
         raise PermissionException("需要超级管理员权限")
 
 
@@ -51,6 +77,9 @@ __all__ = [
     "IsAuthenticated",
     "IsStaffOrSuperuser",
     "IsSuperuser",
+    "IS_AUTHENTICATED",
+    "IS_STAFF_OR_SUPERUSER",
+    "IS_SUPERUSER",
     "ensure_authenticated",
     "ensure_staff_or_superuser",
     "ensure_superuser",
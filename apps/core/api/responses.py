@@ -1,11 +1,60 @@
 """轻量的 API 响应封装，仅负责格式化输出，不包含业务逻辑。"""
-from typing import Any, Dict, List, Optional
-from django.http import JsonResponse
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+from django.http import HttpResponse, StreamingHttpResponse
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+from apps.core.utils.pagination import count_pages
+
+# orjson 原生序列化 UUID/dataclass 与 numpy 数组（如 plotly 图表数据）；
+# datetime/date/time 交给 DjangoJSONEncoder，与 to_iso() 一致输出毫秒精度、UTC 记为 Z
+_JSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_fallback_encoder = NinjaJSONEncoder()
+
+
+def _json_default(obj: Any) -> Any:
+    """日期时间及 orjson 不支持的类型（Decimal、惰性翻译字符串、pydantic 对象等）回退到 NinjaJSONEncoder。"""
+    return _fallback_encoder.default(obj)
+
+
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=_json_default, option=_JSON_OPTIONS)
+
+
+def _json_bytes_response(content: bytes, status: int = 200) -> HttpResponse:
+    return HttpResponse(content, status=status, content_type="application/json")
+
+
+def render_json(payload: Any, status: int = 200) -> HttpResponse:
+    """使用 orjson 直接生成 JSON 字节响应。"""
+    return _json_bytes_response(_dumps(payload), status=status)
+
+
+def ndjson_response(rows: Iterable[Any]) -> StreamingHttpResponse:
+    """逐行输出 NDJSON 的流式响应，内存占用只与数据库分块大小相关。"""
+    return StreamingHttpResponse(
+        (_dumps(row) + b"\n" for row in rows),
+        content_type="application/x-ndjson",
+    )
+
+
+class ORJSONRenderer(BaseRenderer):
+    """NinjaExtraAPI 渲染器：框架生成的响应（Schema 返回值、异常处理、参数校验错误）同样使用 orjson。"""
+
+    media_type = "application/json"
+
+    def render(self, request, data, *, response_status):
+        return _dumps(data)
 
 
 class ApiResponse:
     """统一的API响应格式"""
 
+    # 每个请求都会创建，使用 __slots__ 省去实例 __dict__
+    __slots__ = ("data", "message", "success", "status_code", "code")
+
     def __init__(
         self,
         data: Any = None,
@@ -32,18 +81,26 @@ class ApiResponse:
             response["data"] = self.data
         return response
 
-    def to_json_response(self) -> JsonResponse:
-        """转换为Django JsonResponse"""
-        return JsonResponse(
-            data=self.to_dict(),
-            status=self.status_code,
-            safe=isinstance(self.data, (dict, list)),
-        )
+    def to_json_bytes(self) -> bytes:
+        """直接拼接 JSON 字节（与 to_dict() 输出一致），省去中间字典。"""
+        parts = [b'{"success":', b"true" if self.success else b"false", b',"message":', _dumps(self.message)]
+        if self.code:
+            parts += [b',"code":', _dumps(self.code)]
+        if self.data is not None:
+            parts += [b',"data":', _dumps(self.data)]
+        parts.append(b"}")
+        return b"".join(parts)
+
+    def to_json_response(self) -> HttpResponse:
+        """转换为 JSON HttpResponse"""
+        return _json_bytes_response(self.to_json_bytes(), status=self.status_code)
 
 
 class SuccessResponse(ApiResponse):
     """成功响应"""
 
+    __slots__ = ()
+
     def __init__(self, data: Any = None, message: str = "操作成功", code: str = "ok"):
         super().__init__(data=data, message=message, success=True, status_code=200, code=code)
 
@@ -51,6 +108,8 @@ class SuccessResponse(ApiResponse):
 class CreatedResponse(ApiResponse):
     """创建成功响应"""
 
+    __slots__ = ()
+
     def __init__(self, data: Any = None, message: str = "创建成功", code: str = "created"):
         super().__init__(data=data, message=message, success=True, status_code=201, code=code)
 
@@ -58,41 +117,58 @@ class CreatedResponse(ApiResponse):
 class ErrorResponse(ApiResponse):
     """通用错误响应"""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "操作失败", status_code: int = 400, data: Any = None, code: str = "error"):
         super().__init__(data=data, message=message, success=False, status_code=status_code, code=code)
 
 
+_PAGINATED_PREFIX = b'{"success":true,"message":' + orjson.dumps("获取成功") + b',"data":{"results":'
+
+
 class PaginatedResponse:
     """分页响应格式"""
 
+    __slots__ = ("objects_list", "page", "page_size", "total_count", "total_pages")
+
     def __init__(self, objects_list: List[Any], page: int = 1, page_size: int = 10, total_count: Optional[int] = None):
         self.objects_list = objects_list
         self.page = page
         self.page_size = page_size
         self.total_count = total_count if total_count is not None else len(objects_list)
+        # 总页数在构造时计算一次，to_dict / to_json_bytes 共用；与 count_pages 一致，空结果也算 1 页
+        self.total_pages = count_pages(self.total_count, page_size)
+
+    def _pagination(self) -> Dict[str, Any]:
+        return {
+            "page": self.page,
+            "page_size": self.page_size,
+            "total_count": self.total_count,
+            "total_pages": self.total_pages,
+            "has_next": self.page < self.total_pages,
+            "has_previous": self.page > 1,
+        }
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为分页字典格式"""
-        total_pages = (self.total_count + self.page_size - 1) // self.page_size
         return {
             "success": True,
             "message": "获取成功",
             "data": {
                 "results": self.objects_list,
-                "pagination": {
-                    "page": self.page,
-                    "page_size": self.page_size,
-                    "total_count": self.total_count,
-                    "total_pages": total_pages,
-                    "has_next": self.page < total_pages,
-                    "has_previous": self.page > 1,
-                },
+                "pagination": self._pagination(),
             },
         }
 
-    def to_json_response(self) -> JsonResponse:
-        """转换为Django JsonResponse"""
-        return JsonResponse(self.to_dict())
+    def to_json_bytes(self) -> bytes:
+        """直接拼接 JSON 字节（与 to_dict() 输出一致），结果列表只编码一次。"""
+        return b"".join(
+            (_PAGINATED_PREFIX, _dumps(self.objects_list), b',"pagination":', _dumps(self._pagination()), b"}}")
+        )
+
+    def to_json_response(self) -> HttpResponse:
+        """转换为 JSON HttpResponse"""
+        return _json_bytes_response(self.to_json_bytes())
 
 
 # ==================== API 层辅助函数 ====================
@@ -1,16 +1,21 @@
 """核心认证中间件：确保 request.user 始终存在。"""
 from django.contrib.auth.models import AnonymousUser
 
+# AnonymousUser 无状态，所有请求共享同一实例
+_ANON = AnonymousUser()
+
 
 class AuthMiddleware:
-    """确保 request.user 存在的轻量中间件。"""
+    """确保 request.user 存在的轻量中间件（当前未加入 settings.MIDDLEWARE，由 AuthenticationMiddleware 负责）。"""
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        if not getattr(request, "user", None) or isinstance(request.user, AnonymousUser):
-            request.user = AnonymousUser()
+        # AuthenticationMiddleware 已设置 request.user 时直接放行，仅在缺失时兜底
+        # 直接检查实例字典，不触发 SimpleLazyObject 解析
+        if request.__dict__.get("user") is None:
+            request.user = _ANON
         return self.get_response(request)
 
 
@@ -1,35 +1,46 @@
 """核心 CORS 中间件：为未覆盖的接口补充跨域头。"""
 from django.conf import settings
+from django.http import HttpResponse
 
 
 class CORSApiMiddleware:
-    """简单的 CORS 处理（如已使用 corsheaders，可按需关闭本中间件）。"""
+    """
+    简单的 CORS 处理（如已使用 corsheaders，可按需关闭本中间件）。
+    当前 settings.MIDDLEWARE 使用 corsheaders，本中间件未启用；跨域策略以 CORS_* 配置为准。
+    """
+
+    # 固定不变的跨域头；Max-Age 允许浏览器缓存预检结果 24 小时
+    STATIC_HEADERS = (
+        ("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS"),
+        ("Access-Control-Allow-Headers", "Content-Type, Authorization"),
+        ("Access-Control-Max-Age", "86400"),
+    )
 
     def __init__(self, get_response):
         self.get_response = get_response
         self.allowed_origins = getattr(settings, "CORS_ALLOWED_ORIGINS", [])
         self.allow_all = getattr(settings, "CORS_ALLOW_ALL_ORIGINS", True)
+        # 配置在进程内不变，Origin 头只在初始化时拼接一次
+        self._origin_header = "*" if self.allow_all or not self.allowed_origins else ", ".join(self.allowed_origins)
+        # 完整的跨域头预先组装好，普通响应与预检响应直接复用
+        self._cors_headers = {"Access-Control-Allow-Origin": self._origin_header, **dict(self.STATIC_HEADERS)}
 
     def __call__(self, request):
         if request.method == "OPTIONS":
-            return self._build_preflight_response()
+            return self._build_preflight_response(request)
 
         response = self.get_response(request)
         self._apply_headers(response)
         return response
 
     def _apply_headers(self, response):
-        origin = "*" if self.allow_all or not self.allowed_origins else ", ".join(self.allowed_origins)
-        response["Access-Control-Allow-Origin"] = origin
-        response["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-        response["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
+        for key, value in self._cors_headers.items():
+            response[key] = value
         return response
 
-    def _build_preflight_response(self):
-        from django.http import JsonResponse
-
-        response = JsonResponse({})
-        return self._apply_headers(response)
+    def _build_preflight_response(self, request):
+        # 预检响应无需正文，204 省去 JSON 编码；头部直接取预组装的字典（允许的请求头保持固定白名单）
+        return HttpResponse(status=204, headers=self._cors_headers)
 
 
 __all__ = ["CORSApiMiddleware"]
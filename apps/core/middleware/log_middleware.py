@@ -1,9 +1,12 @@
 """核心日志中间件：收集请求基础数据并交由日志服务处理。"""
-import time
+import logging
+
 from django.conf import settings
 
 from apps.core.utils.request import get_client_ip
-from apps.core.utils.security import sanitize_sensitive_data
+from apps.core.utils.time_utils import duration_seconds_ns, now_ns
+
+logger = logging.getLogger(__name__)
 
 
 class LogMiddleware:
@@ -22,11 +25,15 @@ class LogMiddleware:
             ["/static/", "/media/", "/favicon.ico", "/api/docs/", "/api/openapi.json"],
         )
         self.exclude_status_codes = getattr(settings, "LOG_EXCLUDE_STATUS_CODES", [200, 201, 204])
+        # str.startswith 支持元组，一次调用完成所有前缀匹配
+        self._exclude_paths = tuple(self.exclude_paths)
+        self._exclude_status = frozenset(self.exclude_status_codes)
+        self._log_prefixes = ("/api/", "/manage/")
 
     def __call__(self, request):
-        start_time = time.time()
+        start_ns = now_ns()
         response = self.get_response(request)
-        process_time = time.time() - start_time
+        process_time = duration_seconds_ns(start_ns, now_ns())
 
         if self.should_log(request, response):
             self.log_request(request, response, process_time)
@@ -34,14 +41,30 @@ class LogMiddleware:
 
     def should_log(self, request, response) -> bool:
         """判断是否需要记录日志"""
-        for path in self.exclude_paths:
-            if request.path.startswith(path):
-                return False
-        if response.status_code in self.exclude_status_codes:
+        if response.status_code in self._exclude_status:
             return False
-        if not (request.path.startswith("/api/") or request.path.startswith("/manage/")):
+        path = request.path
+        if path.startswith(self._exclude_paths):
             return False
-        return True
+        return path.startswith(self._log_prefixes)
+
+    @staticmethod
+    def _request_size(request) -> int:
+        """优先使用 CONTENT_LENGTH，避免为统计大小而读取请求体。"""
+        try:
+            return int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _response_size(response) -> int:
+        """流式响应不读取内容，仅取 Content-Length（未知时为 0）。"""
+        if getattr(response, "streaming", False):
+            try:
+                return int(response.get("Content-Length") or 0)
+            except ValueError:
+                return 0
+        return len(response.content)
 
     def log_request(self, request, response, process_time: float):
         """收集基础信息并交给日志服务"""
@@ -52,10 +75,12 @@ class LogMiddleware:
             user = user if user and getattr(user, "is_authenticated", False) else None
 
             extra_data = {
+                # 耗时（秒），与历史日志的键名和单位保持一致
                 "process_time": round(process_time, 3),
-                "request_size": len(getattr(request, "body", b"") or b""),
-                "response_size": len(getattr(response, "content", b"") or b""),
-                "query_params": sanitize_sensitive_data(getattr(request, "GET", {})),
+                "request_size": self._request_size(request),
+                "response_size": self._response_size(response),
+                # 重复参数（?id=1&id=2）保留全部值，单值参数直接存值；脱敏在后台写入时进行
+                "query_params": {k: v if len(v) > 1 else v[0] for k, v in request.GET.lists()},
             }
 
             create_request_log(
@@ -67,5 +92,5 @@ class LogMiddleware:
                 status_code=response.status_code,
                 extra_data=extra_data,
             )
-        except Exception as exc:  # pragma: no cover - 防御性
-            print(f"收集日志信息失败: {exc}")
+        except Exception:  # pragma: no cover - 防御性
+            logger.exception("收集日志信息失败")
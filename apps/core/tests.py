@@ -0,0 +1,66 @@
+"""core 工具测试。"""
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.utils.background import BackgroundBatchWriter
+
+
+class BackgroundBatchWriterTests(SimpleTestCase):
+    """后台批量写入器：同步退化、后台攒批、队列满丢弃与退出时排空。"""
+
+    @override_settings(BACKGROUND_WRITES_ENABLED=False)
+    def test_disabled_writes_synchronously(self):
+        batches = []
+        writer = BackgroundBatchWriter(batches.append, name="test-sync")
+
+        self.assertTrue(writer.submit("a"))
+
+        self.assertEqual(batches, [["a"]])
+        self.assertIsNone(writer._thread)
+
+    @override_settings(BACKGROUND_WRITES_ENABLED=True)
+    def test_enabled_flushes_on_background_thread(self):
+        flushed = []
+        done = threading.Event()
+
+        def flush(batch):
+            flushed.extend(batch)
+            if len(flushed) >= 3:
+                done.set()
+
+        writer = BackgroundBatchWriter(flush, name="test-async", interval=0.05)
+        for item in ("a", "b", "c"):
+            writer.submit(item)
+
+        self.assertTrue(done.wait(timeout=2))
+        self.assertEqual(flushed, ["a", "b", "c"])
+        self.assertNotEqual(writer._thread.ident, threading.get_ident())
+
+    @override_settings(BACKGROUND_WRITES_ENABLED=True)
+    def test_full_queue_drops_and_counts(self):
+        writer = BackgroundBatchWriter(lambda batch: None, name="test-full", maxsize=1)
+        with mock.patch.object(writer, "_ensure_started"):
+            self.assertTrue(writer.submit("a"))
+            self.assertFalse(writer.submit("b"))
+        self.assertEqual(writer.dropped, 1)
+
+    @override_settings(BACKGROUND_WRITES_ENABLED=True)
+    def test_drain_flushes_pending_items(self):
+        batches = []
+        writer = BackgroundBatchWriter(batches.append, name="test-drain")
+        with mock.patch.object(writer, "_ensure_started"):
+            writer.submit("a")
+            writer.submit("b")
+        writer.drain()
+        self.assertEqual(batches, [["a", "b"]])
+
+    @override_settings(BACKGROUND_WRITES_ENABLED=False)
+    def test_flush_errors_are_swallowed(self):
+        def flush(batch):
+            raise RuntimeError("boom")
+
+        writer = BackgroundBatchWriter(flush, name="test-error")
+        with self.assertLogs("apps.core.utils.background", level="ERROR"):
+            self.assertTrue(writer.submit("a"))
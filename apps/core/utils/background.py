@@ -0,0 +1,99 @@
+"""后台批量写入：有界队列 + 守护线程，把审计类 INSERT 移出请求路径。"""
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, List
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundBatchWriter:
+    """
+    进程内后台批量写入器。
+    submit() 只负责入队，后台线程攒批后调用 flush_func；队列满时丢弃并计数，不阻塞请求。
+    BACKGROUND_WRITES_ENABLED = False（如测试环境）时退化为同步写入。
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[List[Any]], Any],
+        *,
+        name: str,
+        maxsize: int = 10000,
+        batch_size: int = 500,
+        interval: float = 0.5,
+    ):
+        self.flush_func = flush_func
+        self.name = name
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        atexit.register(self.drain)
+
+    def submit(self, item: Any) -> bool:
+        """提交一条待写入数据，返回是否已受理。"""
+        if not getattr(settings, "BACKGROUND_WRITES_ENABLED", True):
+            self._flush([item])
+            return True
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("%s 队列已满，丢弃 1 条写入（累计 %d）", self.name, self.dropped)
+            return False
+        return True
+
+    def drain(self) -> None:
+        """同步写出队列中剩余数据（进程退出时调用）。"""
+        batch: List[Any] = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._flush(batch)
+
+    def _ensure_started(self) -> None:
+        # fork 后子进程中的线程对象不再存活，会在首次提交时重新启动
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+            close_old_connections()
+
+    def _flush(self, batch: List[Any]) -> None:
+        try:
+            self.flush_func(batch)
+        except Exception:
+            logger.exception("%s 批量写入失败（%d 条）", self.name, len(batch))
+
+
+__all__ = ["BackgroundBatchWriter"]
@@ -0,0 +1,42 @@
+"""日志处理器：请求线程只入队，由后台线程输出。"""
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class AsyncStreamHandler(QueueHandler):
+    """
+    日志记录写入内存队列，由 QueueListener 后台线程输出到 stderr，
+    请求线程不再争用标准输出的锁。格式化仍在入队时完成（使用本处理器的 formatter）。
+    后台线程在首次输出日志时才启动，未产生日志的进程（如 manage.py 命令）不会多出线程。
+    """
+
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(queue.SimpleQueue())
+        self.setLevel(level)
+        self._listener: QueueListener | None = None
+        self._pid: int | None = None
+        self._start_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # fork 后子进程中的监听线程不再存活，按进程号判断是否需要重新启动
+        if self._pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def _start_listener(self) -> None:
+        with self._start_lock:
+            if self._pid != os.getpid():
+                listener = QueueListener(self.queue, logging.StreamHandler())
+                listener.start()
+                atexit.register(listener.stop)
+                self._listener = listener
+                self._pid = os.getpid()
+
+
+__all__ = ["AsyncStreamHandler"]
@@ -0,0 +1,55 @@
+"""迁移辅助操作。"""
+from __future__ import annotations
+
+from django.db import NotSupportedError
+from django.db.migrations.operations import AddIndex, RunSQL
+
+
+class AddIndexConcurrentlyIfPostgres(AddIndex):
+    """
+    PostgreSQL 上以 CREATE INDEX CONCURRENTLY 建索引，建索引期间不阻塞表读写；
+    其他数据库（如开发用 sqlite）退化为普通 AddIndex。
+    使用该操作的迁移需设置 atomic = False。
+    """
+
+    def describe(self) -> str:
+        fields = ", ".join(self.index.fields)
+        return f"Concurrently create index {self.index.name} on field(s) {fields} of model {self.model_name}"
+
+    def _concurrent(self, schema_editor) -> bool:
+        if schema_editor.connection.vendor != "postgresql":
+            return False
+        if schema_editor.connection.in_atomic_block:
+            raise NotSupportedError(
+                "CONCURRENTLY 建索引不能在事务中执行，请在迁移中设置 atomic = False"
+            )
+        return True
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not self._concurrent(schema_editor):
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not self._concurrent(schema_editor):
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+
+
+class RunSQLIfPostgres(RunSQL):
+    """仅在 PostgreSQL 上执行的 RunSQL（扩展、GIN 等专有索引），其他数据库直接跳过。"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+__all__ = ["AddIndexConcurrentlyIfPostgres", "RunSQLIfPostgres"]
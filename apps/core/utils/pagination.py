@@ -0,0 +1,69 @@
+"""分页辅助工具。"""
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from apps.core.api.exceptions import ValidationException
+
+
+def count_pages(total: int, page_size: int) -> int:
+    """由总数直接计算页数（与 Paginator 一致：空结果也算 1 页），无需再次查询。"""
+    if page_size <= 0:
+        return 1
+    return max(1, -(-total // page_size))
+
+
+def encode_cursor(value: datetime, pk: Any) -> str:
+    """将排序字段值与主键编码为 URL 安全的游标。"""
+    raw = f"{value.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """解析游标：时间须带时区、主键须为 UUID，格式非法时抛 ValidationException。"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        value, pk = raw.split("|", 1)
+        moment = datetime.fromisoformat(value)
+        if timezone.is_naive(moment):
+            raise ValueError("naive cursor datetime")
+        return moment, UUID(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationException("无效的分页游标")
+
+
+def _row_value(row: Any, field: str) -> Any:
+    return row[field] if isinstance(row, dict) else getattr(row, field)
+
+
+def keyset_paginate(
+    queryset: QuerySet,
+    cursor: Optional[str],
+    page_size: int,
+    field: str = "created_at",
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    按 (field DESC, id DESC) 游标分页：每页一次索引范围扫描，不执行 COUNT。
+    cursor 为空表示第一页；返回当前页数据与下一页游标（无更多数据时为 None）。
+    支持模型实例与 values() 字典行（需包含 field 与 id）。
+    """
+    queryset = queryset.order_by(f"-{field}", "-id")
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk}))
+    rows = list(queryset[: page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(_row_value(last, field), _row_value(last, "id"))
+
+
+__all__ = ["count_pages", "encode_cursor", "decode_cursor", "keyset_paginate"]
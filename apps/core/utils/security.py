@@ -5,6 +5,12 @@ from typing import Any
 SENSITIVE_KEYS = ("password", "token", "secret", "key", "auth", "csrf")
 
 
+def _is_sensitive_key(key: Any) -> bool:
+    """键名包含任一敏感词即视为敏感（如 access_token、csrfmiddlewaretoken）。"""
+    lowered = str(key).lower()
+    return any(field in lowered for field in SENSITIVE_KEYS)
+
+
 def mask_value(value: str, visible: int = 2) -> str:
     """对字符串做简单脱敏，保留前后若干位。"""
     if not value or not isinstance(value, str):
@@ -20,9 +26,11 @@ def sanitize_sensitive_data(data: Any):
         return data
 
     if isinstance(data, dict):
+        if not data:
+            return {}
         sanitized = {}
         for key, value in data.items():
-            if any(field in key.lower() for field in SENSITIVE_KEYS):
+            if _is_sensitive_key(key):
                 sanitized[key] = "***"
             elif isinstance(value, dict):
                 sanitized[key] = sanitize_sensitive_data(value)
@@ -4,10 +4,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, Iterable
 
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+_django_encoder = DjangoJSONEncoder()
+
 
 def to_iso(dt: datetime | None) -> str | None:
-    """安全地将 datetime 转为 ISO 字符串。"""
-    return dt.isoformat() if dt else None
+    """安全地将 datetime 转为 ISO 字符串（与 DjangoJSONEncoder 相同：毫秒精度，UTC 记为 Z）。"""
+    return _django_encoder.default(dt) if dt else None
 
 
 def model_to_dict_iso(instance, fields: Iterable[str]) -> Dict[str, Any]:
@@ -25,4 +30,13 @@ def model_to_dict_iso(instance, fields: Iterable[str]) -> Dict[str, Any]:
     return result
 
 
-__all__ = ["to_iso", "model_to_dict_iso"]
+class ExtendedJSONEncoder(DjangoJSONEncoder):
+    """在 DjangoJSONEncoder（datetime/date/UUID/Decimal）基础上支持集合，供 JSONField 使用。"""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (set, frozenset)):
+            return list(o)
+        return super().default(o)
+
+
+__all__ = ["to_iso", "model_to_dict_iso", "ExtendedJSONEncoder"]
@@ -1,5 +1,6 @@
 """时间与耗时相关的轻量工具。"""
 import datetime
+import time
 from typing import Union
 
 
@@ -13,4 +14,14 @@ def duration_ms(start: Union[int, float], end: Union[int, float]) -> int:
     return int((end - start) * 1000)
 
 
-__all__ = ["now", "duration_ms"]
+def now_ns() -> int:
+    """单调时钟纳秒值，仅用于计算耗时（不受系统时间调整影响）。"""
+    return time.monotonic_ns()
+
+
+def duration_seconds_ns(start_ns: int, end_ns: int) -> float:
+    """由 now_ns() 的两个读数计算耗时秒数。"""
+    return (end_ns - start_ns) / 1_000_000_000
+
+
+__all__ = ["now", "duration_ms", "now_ns", "duration_seconds_ns"]
@@ -5,6 +5,13 @@
 import re
 from django.core.exceptions import ValidationError
 
+# 模块加载时预编译，校验时直接复用
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_]+$")
+_DIGIT_RE = re.compile(r"\d")
+_ALPHA_RE = re.compile(r"[a-zA-Z]")
+_PHONE_RE = re.compile(r"^1[3-9]\d{9}$")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 def validate_username(username):
     """验证用户名格式"""
@@ -14,7 +21,7 @@ def validate_username(username):
         raise ValidationError("用户名长度不能少于3个字符")
     if len(username) > 20:
         raise ValidationError("用户名长度不能超过20个字符")
-    if not re.match(r"^[a-zA-Z0-9_]+$", username):
+    if not _USERNAME_RE.match(username):
         raise ValidationError("用户名只能包含字母、数字和下划线")
     return True
 
@@ -25,9 +32,9 @@ def validate_password_strength(password):
         raise ValidationError("密码不能为空")
     if len(password) < 8:
         raise ValidationError("密码长度不能少于8个字符")
-    if not re.search(r"\d", password):
+    if not _DIGIT_RE.search(password):
         raise ValidationError("密码必须包含至少一个数字")
-    if not re.search(r"[a-zA-Z]", password):
+    if not _ALPHA_RE.search(password):
         raise ValidationError("密码必须包含至少一个字母")
     return True
 
@@ -36,7 +43,7 @@ def validate_phone(phone):
     """验证手机号格式（可为空）"""
     if not phone:
         return True
-    if not re.match(r"^1[3-9]\d{9}$", phone):
+    if not _PHONE_RE.match(phone):
         raise ValidationError("请输入有效的手机号码")
     return True
 
@@ -45,8 +52,7 @@ def validate_email(email):
     """验证邮箱格式"""
     if not email:
         raise ValidationError("邮箱不能为空")
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(email_pattern, email):
+    if not _EMAIL_RE.match(email):
         raise ValidationError("请输入有效的邮箱地址")
     return True
 
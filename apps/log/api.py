@@ -10,7 +10,7 @@ from ninja_extra import (
     ControllerBase,
 )
 from apps.core.api.responses import success_response, error_response
-from apps.core.api.permissions import IsStaffOrSuperuser
+from apps.core.api.permissions import IS_STAFF_OR_SUPERUSER
 
 from .services import (
     delete_log,
@@ -76,6 +76,7 @@ class LogController(ControllerBase):
         path: Optional[str] = Query(None),
         method: Optional[str] = Query(None),
         status_code: Optional[int] = Query(None),
+        cursor: Optional[str] = Query(None, description="游标分页：首页传空串，之后传上次返回的 next_cursor"),
     ):
         """带过滤与分页的列表 - 服务层处理过滤/分页"""
         data = paginate_logs(
@@ -91,6 +92,7 @@ class LogController(ControllerBase):
             path=path,
             method=method,
             status_code=status_code,
+            cursor=cursor,
         )
         return success_response(data=data, message="获取日志列表成功")
 
@@ -108,7 +110,7 @@ class LogController(ControllerBase):
             return error_response(message="日志不存在", status_code=404)
         return success_response(data=log, message="获取日志详情成功")
 
-    @route.post("/seed", permissions=[IsStaffOrSuperuser])
+    @route.post("/seed", permissions=[IS_STAFF_OR_SUPERUSER])
     def seed(self, payload: LogSeedSchema):
         """批量生成测试日志"""
         result = seed_logs(self.context.request.user, count=payload.count, level=payload.level, category=payload.category)
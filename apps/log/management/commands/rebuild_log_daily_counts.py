@@ -0,0 +1,12 @@
+"""按日志表重建日统计。"""
+from django.core.management.base import BaseCommand
+
+from apps.log.services import rebuild_log_daily_counts
+
+
+class Command(BaseCommand):
+    help = "按日志表重建 LogDailyCount（部署后及定期对账时执行）"
+
+    def handle(self, *args, **options):
+        rows = rebuild_log_daily_counts()
+        self.stdout.write(self.style.SUCCESS(f"已重建日志日统计：{rows} 行"))
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-16 14:10
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('log', '0002_alter_log_options_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='log',
+            index=models.Index(fields=['-created_at', '-id'], name='log_created_id_desc'),
+        ),
+    ]
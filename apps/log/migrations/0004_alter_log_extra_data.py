@@ -0,0 +1,19 @@
+# Generated by Django 5.0.3 on 2026-10-16 14:30
+
+import apps.core.utils.serializers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('log', '0003_log_created_id_desc'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='log',
+            name='extra_data',
+            field=models.JSONField(blank=True, default=dict, encoder=apps.core.utils.serializers.ExtendedJSONEncoder, help_text='额外的结构化数据，如请求参数、响应数据等', verbose_name='额外数据'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.3 on 2026-10-16 14:50
+
+from django.db import migrations
+
+from apps.core.utils.migration_ops import RunSQLIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('log', '0004_alter_log_extra_data'),
+    ]
+
+    operations = [
+        RunSQLIfPostgres(
+            sql='CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        RunSQLIfPostgres(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS log_path_trgm ON log_log USING gin (path gin_trgm_ops);',
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS log_path_trgm;',
+        ),
+        RunSQLIfPostgres(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS log_action_trgm ON log_log USING gin (action gin_trgm_ops);',
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS log_action_trgm;',
+        ),
+    ]
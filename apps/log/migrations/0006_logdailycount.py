@@ -0,0 +1,46 @@
+# Generated by Django 5.0.3 on 2026-10-16 15:10
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_counts(apps, schema_editor):
+    Log = apps.get_model('log', 'Log')
+    LogDailyCount = apps.get_model('log', 'LogDailyCount')
+    rows = (
+        Log.objects.annotate(day=TruncDate('created_at'))
+        .values_list('day', 'level', 'category')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+    LogDailyCount.objects.bulk_create(
+        [LogDailyCount(day=day, level=level, category=category, count=n) for day, level, category, n in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('log', '0005_log_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='日期')),
+                ('level', models.CharField(choices=[('DEBUG', '调试'), ('INFO', '信息'), ('WARNING', '警告'), ('ERROR', '错误'), ('CRITICAL', '严重')], max_length=10, verbose_name='日志级别')),
+                ('category', models.CharField(choices=[('auth', '认证'), ('user', '用户'), ('system', '系统'), ('api', 'API'), ('admin', '管理'), ('notification', '通知'), ('other', '其他')], max_length=20, verbose_name='日志类别')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='条数')),
+            ],
+            options={
+                'verbose_name': '日志日统计',
+                'verbose_name_plural': '日志日统计',
+                'constraints': [models.UniqueConstraint(fields=('day', 'level', 'category'), name='unique_log_daily_count')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_counts, migrations.RunPython.noop),
+    ]
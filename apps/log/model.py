@@ -4,6 +4,7 @@ from django.db import models
 from model_utils import Choices
 
 from apps.core.models import BaseModel
+from apps.core.utils.serializers import ExtendedJSONEncoder
 
 
 class Log(BaseModel):
@@ -92,6 +93,7 @@ class Log(BaseModel):
         "额外数据",
         default=dict,
         blank=True,
+        encoder=ExtendedJSONEncoder,
         help_text="额外的结构化数据，如请求参数、响应数据等"
     )
 
@@ -103,7 +105,28 @@ class Log(BaseModel):
             models.Index(fields=["level", "created_at"]),
             models.Index(fields=["category", "created_at"]),
             models.Index(fields=["user", "created_at"]),
+            # 列表游标分页：按 (created_at, id) 倒序做索引范围扫描
+            models.Index(fields=["-created_at", "-id"], name="log_created_id_desc"),
         ]
 
     def __str__(self) -> str:
         return f"[{self.level}] {self.category} - {self.action} - {self.created_at}"
+
+
+class LogDailyCount(models.Model):
+    """按 (日期, 级别, 类别) 汇总的日志条数，供统计接口读取，避免全表扫描。"""
+
+    day = models.DateField("日期")
+    level = models.CharField("日志级别", max_length=10, choices=Log.LEVEL)
+    category = models.CharField("日志类别", max_length=20, choices=Log.CATEGORY)
+    count = models.PositiveIntegerField("条数", default=0)
+
+    class Meta:
+        verbose_name = "日志日统计"
+        verbose_name_plural = "日志日统计"
+        constraints = [
+            models.UniqueConstraint(fields=["day", "level", "category"], name="unique_log_daily_count"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.level} {self.category}: {self.count}"
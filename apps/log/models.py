@@ -1,4 +1,4 @@
 """Django models module wrapper for auto-discovery."""
-from .model import Log
+from .model import Log, LogDailyCount
 
-__all__ = ["Log"]
+__all__ = ["Log", "LogDailyCount"]
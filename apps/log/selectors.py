@@ -3,10 +3,45 @@ from django.db.models import QuerySet
 
 from .model import Log
 
+# 列表序列化所需字段（含操作用户），values() 直接取字典行
+LOG_LIST_FIELDS = (
+    "id",
+    "level",
+    "category",
+    "message",
+    "user_id",
+    "user__username",
+    "ip_address",
+    "user_agent",
+    "path",
+    "method",
+    "status_code",
+    "action",
+    "extra_data",
+    "created_at",
+)
+# 详情 only() 字段：关联用户只加载主键与用户名
+LOG_DETAIL_FIELDS = (
+    "id",
+    "level",
+    "category",
+    "message",
+    "user__id",
+    "user__username",
+    "ip_address",
+    "user_agent",
+    "path",
+    "method",
+    "status_code",
+    "action",
+    "extra_data",
+    "created_at",
+)
+
 
 def base_logs_queryset() -> QuerySet:
     """基础查询：按创建时间倒序并预取用户。"""
     return Log.objects.filter(is_deleted=False).select_related("user").order_by("-created_at")
 
 
-__all__ = ["base_logs_queryset"]
+__all__ = ["LOG_LIST_FIELDS", "LOG_DETAIL_FIELDS", "base_logs_queryset"]
@@ -1,37 +1,32 @@
 """日志业务服务层（Services），去除 Flow/Action 过度分层。"""
-from datetime import datetime, timedelta, date
-from typing import Optional, Dict, Any, Tuple, List
-from uuid import UUID
+from collections import Counter
+from datetime import date, datetime, timedelta
+import logging
+from typing import Optional, Dict, Any, Iterable, Tuple, List
+from uuid import UUID, uuid4
 import random
 from faker import Faker
 
 from django.contrib.auth import get_user_model
 from django.core.paginator import Paginator
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet, Sum
+from django.db.models.functions import Greatest, TruncDate
 from django.utils import timezone
+from apps.core.utils.background import BackgroundBatchWriter
+from apps.core.utils.pagination import keyset_paginate
 from apps.core.utils.request import get_client_ip
+from apps.core.utils.security import sanitize_sensitive_data
 from apps.core.utils.serializers import to_iso
 from apps.core.api.permissions import ensure_staff_or_superuser
 from apps.core.api.exceptions import ValidationException
 
-from .model import Log
-from .selectors import base_logs_queryset
+from .model import Log, LogDailyCount
+from .selectors import LOG_DETAIL_FIELDS, LOG_LIST_FIELDS, base_logs_queryset
 
 User = get_user_model()
 faker = Faker("zh_CN")
-
-
-def _normalize_extra_data(value: Any) -> Any:
-    """将日志附加数据转换为可 JSON 序列化的结构。"""
-    if isinstance(value, UUID):
-        return str(value)
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    if isinstance(value, (list, tuple, set)):
-        return [_normalize_extra_data(v) for v in value]
-    if isinstance(value, dict):
-        return {str(k): _normalize_extra_data(v) for k, v in value.items()}
-    return value
+logger = logging.getLogger(__name__)
 
 
 def filter_logs(
@@ -46,31 +41,30 @@ def filter_logs(
     method: Optional[str] = None,
     status_code: Optional[int] = None,
 ) -> QuerySet:
-    """基于筛选条件返回日志查询集。"""
-    queryset = base_logs_queryset()
-
+    """基于筛选条件返回日志查询集（条件先收集，只 filter 一次）。"""
+    filters: Dict[str, Any] = {}
     if level:
-        queryset = queryset.filter(level=level)
+        filters["level"] = level
     if category:
-        queryset = queryset.filter(category=category)
+        filters["category"] = category
     if user_id:
-        queryset = queryset.filter(user_id=user_id)
+        filters["user_id"] = user_id
     if action:
-        queryset = queryset.filter(action__icontains=action)
+        filters["action__icontains"] = action
     if start_date:
-        queryset = queryset.filter(created_at__gte=start_date)
+        filters["created_at__gte"] = start_date
     if end_date:
-        queryset = queryset.filter(created_at__lte=end_date)
+        filters["created_at__lte"] = end_date
     if ip_address:
-        queryset = queryset.filter(ip_address__icontains=ip_address)
+        filters["ip_address__icontains"] = ip_address
     if path:
-        queryset = queryset.filter(path__icontains=path)
+        filters["path__icontains"] = path
     if method:
-        queryset = queryset.filter(method=method)
+        filters["method"] = method
     if status_code:
-        queryset = queryset.filter(status_code=status_code)
+        filters["status_code"] = status_code
 
-    return queryset
+    return base_logs_queryset().filter(**filters)
 
 
 def resolve_log_level(status_code: int) -> str:
@@ -84,18 +78,21 @@ def resolve_log_level(status_code: int) -> str:
     return Log.LEVEL.ERROR
 
 
+# 路径前缀 -> 日志类别，按顺序匹配（更具体的前缀在前）
+_CATEGORY_PREFIXES = (
+    ("/api/auth/", Log.CATEGORY.auth),
+    ("/api/user/", Log.CATEGORY.user),
+    ("/api/notification/", Log.CATEGORY.notification),
+    ("/api/", Log.CATEGORY.api),
+    ("/manage/", Log.CATEGORY.admin),
+)
+
+
 def resolve_log_category(path: str) -> str:
     """根据路径确定日志类别。"""
-    if path.startswith("/api/auth/"):
-        return Log.CATEGORY.auth
-    if path.startswith("/api/user/"):
-        return Log.CATEGORY.user
-    if path.startswith("/api/notification/"):
-        return Log.CATEGORY.notification
-    if path.startswith("/api/"):
-        return Log.CATEGORY.api
-    if path.startswith("/manage/"):
-        return Log.CATEGORY.admin
+    for prefix, category in _CATEGORY_PREFIXES:
+        if path.startswith(prefix):
+            return category
     return Log.CATEGORY.system
 
 
@@ -132,22 +129,95 @@ def create_log_entry(
     extra_data: Optional[Dict[str, Any]] = None,
 ) -> Log:
     """创建日志记录。"""
-    normalized_extra = _normalize_extra_data(extra_data or {})
-    return Log.objects.create(
-        user=user,
-        level=level,
-        category=category,
-        action=action,
-        message=message,
-        ip_address=ip_address,
-        user_agent=user_agent,
-        path=path,
-        method=method,
-        status_code=status_code,
-        extra_data=normalized_extra,
+    with transaction.atomic():
+        log = Log.objects.create(
+            user=user,
+            level=level,
+            category=category,
+            action=action,
+            message=message,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            path=path,
+            method=method,
+            status_code=status_code,
+            extra_data=extra_data or {},
+        )
+        _bump_daily_counts([(log.created_at, log.level, log.category)])
+    return log
+
+
+def _bump_daily_counts(rows: Iterable[Tuple[datetime, str, str]], sign: int = 1) -> None:
+    """按 (本地日期, 级别, 类别) 增减日志日统计，rows 为 (created_at, level, category)。"""
+    _apply_daily_counts(
+        Counter((timezone.localdate(created_at), level, category) for created_at, level, category in rows), sign
     )
 
 
+def _apply_daily_counts(groups: Dict[Tuple[date, str, str], int], sign: int = 1) -> None:
+    """groups 为 (日期, 级别, 类别) -> 条数，每组一条 UPDATE。"""
+    for (day, level, category), n in groups.items():
+        delta = sign * n
+        counters = LogDailyCount.objects.filter(day=day, level=level, category=category)
+        # 计数可能已与日志表有偏差，减到 0 为止，不违反非负约束
+        if counters.update(count=Greatest(F("count") + delta, 0)) or delta < 0:
+            continue
+        _, created = LogDailyCount.objects.get_or_create(
+            day=day, level=level, category=category, defaults={"count": delta}
+        )
+        if not created:
+            # 并发进程已先行创建
+            counters.update(count=F("count") + delta)
+
+
+def _delete_logs(logs: QuerySet) -> int:
+    """删除日志并扣减日统计：先在库内按 (日期, 级别, 类别) 分组计数，再整体删除，每组扣减一次。"""
+    with transaction.atomic():
+        groups = {
+            (day, level, category): n
+            for day, level, category, n in logs.annotate(day=TruncDate("created_at"))
+            .values_list("day", "level", "category")
+            .annotate(n=Count("id"))
+            .order_by()
+        }
+        if not groups:
+            return 0
+        deleted, _ = logs.delete()
+        _apply_daily_counts(groups, sign=-1)
+    return deleted
+
+
+def rebuild_log_daily_counts() -> int:
+    """按日志表重建日统计（修正绕过服务层的写入造成的偏差），返回写入的行数。"""
+    rows = (
+        Log.objects.annotate(day=TruncDate("created_at"))
+        .values_list("day", "level", "category")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        LogDailyCount.objects.all().delete()
+        created = LogDailyCount.objects.bulk_create(
+            [LogDailyCount(day=day, level=level, category=category, count=n) for day, level, category, n in rows],
+            batch_size=1000,
+        )
+    return len(created)
+
+
+def _bulk_create_request_logs(entries: List[Log]) -> None:
+    # 附加数据脱敏在后台线程中完成；UUID/时间等类型由 JSONField 编码器处理
+    for entry in entries:
+        entry.extra_data = sanitize_sensitive_data(entry.extra_data)
+    with transaction.atomic():
+        Log.objects.bulk_create(entries, batch_size=500)
+        _bump_daily_counts((entry.created_at, entry.level, entry.category) for entry in entries)
+
+
+# 请求日志由后台线程批量写入，中间件只负责构造对象并入队（created_at 仍为请求时刻）
+# 审计日志（create_log）不走该队列，保持同步写入
+_request_log_writer = BackgroundBatchWriter(_bulk_create_request_logs, name="request-log-writer")
+
+
 def create_request_log(
     *,
     user: Optional[User],
@@ -158,29 +228,31 @@ def create_request_log(
     status_code: int,
     extra_data: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """记录请求日志（异常不影响主流程）。"""
+    """记录请求日志：构造日志对象后交由后台批量写入（异常不影响主流程）。"""
     level = resolve_log_level(status_code)
     category = resolve_log_category(path)
     action = resolve_log_action(method, path)
     message = f"{method} {path} - {status_code}"
 
     try:
-        create_log_entry(
-            level=level,
-            category=category,
-            action=action,
-            message=message,
-            user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            path=path,
-            method=method,
-            status_code=status_code,
-            extra_data=extra_data,
+        _request_log_writer.submit(
+            Log(
+                user=user,
+                level=level,
+                category=category,
+                action=action,
+                message=message,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                path=path,
+                method=method,
+                status_code=status_code,
+                extra_data=extra_data or {},
+            )
         )
-    except Exception as exc:
+    except Exception:
         # 记录日志失败不应该影响正常业务流程
-        print(f"创建请求日志失败: {exc}")
+        logger.exception("创建请求日志失败")
 
 
 # 便捷写日志函数（替代原 actions 层）
@@ -213,7 +285,7 @@ def create_log(
         action=action or "unknown",
         message=message or "",
         user=user,
-        ip_address=ip_address or "",
+        ip_address=ip_address or None,
         user_agent=user_agent or "",
         path=path or "",
         method=method or "",
@@ -258,11 +330,9 @@ def log_notification_action(action, message, level: str = Log.LEVEL.INFO, user=N
 def delete_log(log_id: str) -> Tuple[bool, str]:
     """删除单个日志。"""
     try:
-        log = Log.objects.get(id=log_id)
-        log.delete()
+        if not _delete_logs(Log.objects.filter(id=log_id)):
+            return False, "日志不存在"
         return True, ""
-    except Log.DoesNotExist:
-        return False, "日志不存在"
     except Exception as exc:
         return False, f"删除失败: {exc}"
 
@@ -270,7 +340,8 @@ def delete_log(log_id: str) -> Tuple[bool, str]:
 def get_log_detail(log_id: str) -> Optional[Dict[str, Any]]:
     """获取单个日志详情。"""
     try:
-        log = Log.objects.select_related("user").get(id=log_id)
+        # 用户只取 id/username，不加载整行
+        log = Log.objects.select_related("user").only(*LOG_DETAIL_FIELDS).get(id=log_id)
         return {
             "id": str(log.id),
             "level": log.level,
@@ -297,28 +368,54 @@ def delete_logs_batch(log_ids: List[str]) -> Tuple[int, str]:
         return 0, "请选择要删除的日志"
 
     try:
-        logs = Log.objects.filter(id__in=log_ids)
-        count = logs.count()
-        logs.delete()
-        return count, ""
+        return _delete_logs(Log.objects.filter(id__in=log_ids)), ""
     except Exception as exc:
         return 0, f"批量删除失败: {exc}"
 
 
 def get_log_stats() -> Dict[str, Any]:
     """获取日志统计信息。"""
-    level_stats = {level: Log.objects.filter(level=level).count() for level, _ in Log.LEVEL}
-    category_stats = {cat: Log.objects.filter(category=cat).count() for cat, _ in Log.CATEGORY}
-    recent_count = Log.objects.filter(created_at__gte=timezone.now() - timedelta(days=7)).count()
-    today_count = Log.objects.filter(created_at__date=timezone.now().date()).count()
-    total_count = Log.objects.count()
+    # 全部统计读取日统计表（行数只与天数相关），缺失的键补 0
+    daily = LogDailyCount.objects.order_by()
+    level_counts = dict(daily.values_list("level").annotate(n=Sum("count")))
+    category_counts = dict(daily.values_list("category").annotate(n=Sum("count")))
+    level_stats = {level: level_counts.get(level, 0) for level, _ in Log.LEVEL}
+    category_stats = {cat: category_counts.get(cat, 0) for cat, _ in Log.CATEGORY}
+
+    # 今日 / 近 7 天（含今日的 7 个自然日）同样按日汇总，一次条件聚合
+    today = timezone.localdate()
+    totals = daily.aggregate(
+        today=Sum("count", filter=Q(day=today)),
+        recent=Sum("count", filter=Q(day__gte=today - timedelta(days=6))),
+    )
 
     return {
         "level_stats": level_stats,
         "category_stats": category_stats,
-        "recent_count": recent_count,
-        "today_count": today_count,
-        "total_count": total_count,
+        "recent_count": totals["recent"] or 0,
+        "today_count": totals["today"] or 0,
+        "total_count": sum(level_counts.values()),
+    }
+
+
+def _serialize_log(row: Dict[str, Any]) -> Dict[str, Any]:
+    """将 values() 字典行转换为列表输出格式。"""
+    user_id = row["user_id"]
+    return {
+        "id": str(row["id"]),
+        "level": row["level"],
+        "category": row["category"],
+        "message": row["message"],
+        "user_id": str(user_id) if user_id else None,
+        "username": row["user__username"],
+        "ip_address": row["ip_address"],
+        "user_agent": row["user_agent"],
+        "path": row["path"],
+        "method": row["method"],
+        "status_code": row["status_code"],
+        "action": row["action"],
+        "extra_data": row["extra_data"],
+        "created": to_iso(row["created_at"]),
     }
 
 
@@ -336,8 +433,9 @@ def paginate_logs(
     path: Optional[str] = None,
     method: Optional[str] = None,
     status_code: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """分页获取日志列表。"""
+    """分页获取日志列表；传入 cursor（首页为空串）时使用游标分页，不统计总数。"""
     queryset = filter_logs(
         level=level,
         category=category,
@@ -349,33 +447,21 @@ def paginate_logs(
         path=path,
         method=method,
         status_code=status_code,
-    )
+    ).values(*LOG_LIST_FIELDS)
+
+    if cursor is not None:
+        page_objects, next_cursor = keyset_paginate(queryset, cursor, per_page)
+        return {
+            "items": [_serialize_log(row) for row in page_objects],
+            "per_page": per_page,
+            "next_cursor": next_cursor,
+        }
 
     paginator = Paginator(queryset, per_page)
     page_obj = paginator.get_page(page)
 
-    items = [
-        {
-            "id": str(log.id),
-            "level": log.level,
-            "category": log.category,
-            "message": log.message,
-            "user_id": str(log.user.id) if log.user else None,
-            "username": log.user.username if log.user else None,
-            "ip_address": log.ip_address,
-            "user_agent": log.user_agent,
-            "path": log.path,
-            "method": log.method,
-            "status_code": log.status_code,
-            "action": log.action,
-            "extra_data": log.extra_data,
-            "created": to_iso(log.created_at),
-        }
-        for log in page_obj
-    ]
-
     return {
-        "items": items,
+        "items": [_serialize_log(row) for row in page_obj],
         "count": paginator.count,
         "page": page,
         "per_page": per_page,
@@ -400,26 +486,39 @@ def seed_logs(
 
     level_choices = [lvl for lvl, _ in Log.LEVEL]
     category_choices = [cat for cat, _ in Log.CATEGORY]
-
-    logs: List[Log] = []
-    for _ in range(count):
-        logs.append(
-            Log(
-                level=level if level else random.choice(level_choices),
-                category=category if category else random.choice(category_choices),
-                action=faker.word(),
-                message=faker.sentence(nb_words=12),
-                user=operator if operator and operator.is_authenticated else None,
-                ip_address=faker.ipv4_public(),
-                user_agent=faker.user_agent(),
-                path=f"/api/{faker.word()}/{faker.random_int(min=1, max=999)}",
-                method=random.choice(["GET", "POST", "PUT", "DELETE"]),
-                status_code=random.choice([200, 201, 400, 401, 403, 404, 500]),
-                extra_data={"trace_id": faker.uuid4(), "seed": True},
-            )
+    user = operator if operator and operator.is_authenticated else None
+
+    # 随机字段按列一次性生成，再逐行组装
+    levels = [level] * count if level else random.choices(level_choices, k=count)
+    categories = [category] * count if category else random.choices(category_choices, k=count)
+    actions = faker.words(nb=count)
+    messages = faker.sentences(nb=count)
+    resources = faker.words(nb=count)
+    methods = random.choices(["GET", "POST", "PUT", "DELETE"], k=count)
+    status_codes = random.choices([200, 201, 400, 401, 403, 404, 500], k=count)
+
+    logs = [
+        Log(
+            level=row_level,
+            category=row_category,
+            action=action,
+            message=message,
+            user=user,
+            ip_address=faker.ipv4_public(),
+            user_agent=faker.user_agent(),
+            path=f"/api/{resource}/{random.randint(1, 999)}",
+            method=method,
+            status_code=status_code,
+            extra_data={"trace_id": str(uuid4()), "seed": True},
         )
+        for row_level, row_category, action, message, resource, method, status_code in zip(
+            levels, categories, actions, messages, resources, methods, status_codes
+        )
+    ]
 
-    Log.objects.bulk_create(logs)
+    with transaction.atomic():
+        Log.objects.bulk_create(logs)
+        _bump_daily_counts((log.created_at, log.level, log.category) for log in logs)
     return {"created": len(logs), "level": level, "category": category}
 
 
@@ -431,6 +530,7 @@ __all__ = [
     "filter_logs",
     "get_log_stats",
     "paginate_logs",
+    "rebuild_log_daily_counts",
     "resolve_log_action",
     "resolve_log_category",
     "resolve_log_level",
@@ -0,0 +1,77 @@
+"""日志应用测试。"""
+from uuid import uuid4
+
+from django.test import TestCase
+from django.utils import timezone
+
+from .model import Log, LogDailyCount
+from .services import create_log_entry, delete_log, delete_logs_batch, get_log_stats, rebuild_log_daily_counts
+
+
+def _count(level: str, category: str) -> int:
+    row = LogDailyCount.objects.filter(day=timezone.localdate(), level=level, category=category).first()
+    return row.count if row else 0
+
+
+class LogDailyCountTests(TestCase):
+    """日统计随写入/删除同步，偏差可被重建修正。"""
+
+    def _create(self, level=Log.LEVEL.INFO, category=Log.CATEGORY.api) -> Log:
+        return create_log_entry(level=level, category=category, action="test")
+
+    def test_create_increments_and_stats_read_summary(self):
+        self._create()
+        self._create()
+        self._create(level=Log.LEVEL.ERROR, category=Log.CATEGORY.auth)
+
+        self.assertEqual(_count(Log.LEVEL.INFO, Log.CATEGORY.api), 2)
+        stats = get_log_stats()
+        self.assertEqual(stats["total_count"], 3)
+        self.assertEqual(stats["today_count"], 3)
+        self.assertEqual(stats["recent_count"], 3)
+        self.assertEqual(stats["level_stats"][Log.LEVEL.ERROR], 1)
+        self.assertEqual(stats["category_stats"][Log.CATEGORY.api], 2)
+        self.assertEqual(stats["level_stats"][Log.LEVEL.DEBUG], 0)
+
+    def test_delete_services_decrement_once_per_group(self):
+        first, second, _ = self._create(), self._create(), self._create(level=Log.LEVEL.ERROR)
+        third = self._create(level=Log.LEVEL.ERROR)
+
+        ok, _ = delete_log(str(first.pk))
+        self.assertTrue(ok)
+        self.assertEqual(_count(Log.LEVEL.INFO, Log.CATEGORY.api), 1)
+
+        deleted, _ = delete_logs_batch([str(second.pk), str(third.pk)])
+        self.assertEqual(deleted, 2)
+        self.assertEqual(_count(Log.LEVEL.INFO, Log.CATEGORY.api), 0)
+        self.assertEqual(_count(Log.LEVEL.ERROR, Log.CATEGORY.api), 1)
+
+    def test_delete_missing_log_leaves_counts(self):
+        self._create()
+
+        ok, message = delete_log(str(uuid4()))
+
+        self.assertFalse(ok)
+        self.assertEqual(message, "日志不存在")
+        self.assertEqual(_count(Log.LEVEL.INFO, Log.CATEGORY.api), 1)
+
+    def test_decrement_clamps_at_zero(self):
+        log = self._create()
+        LogDailyCount.objects.update(count=0)
+
+        delete_log(str(log.pk))
+
+        self.assertEqual(_count(Log.LEVEL.INFO, Log.CATEGORY.api), 0)
+
+    def test_rebuild_fixes_drift(self):
+        self._create()
+        self._create(level=Log.LEVEL.WARNING)
+        LogDailyCount.objects.all().delete()
+        LogDailyCount.objects.create(day=timezone.localdate(), level=Log.LEVEL.DEBUG, category=Log.CATEGORY.other, count=9)
+
+        rows = rebuild_log_daily_counts()
+
+        self.assertEqual(rows, 2)
+        self.assertEqual(_count(Log.LEVEL.INFO, Log.CATEGORY.api), 1)
+        self.assertEqual(_count(Log.LEVEL.WARNING, Log.CATEGORY.api), 1)
+        self.assertEqual(get_log_stats()["total_count"], 2)
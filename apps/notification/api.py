@@ -14,8 +14,7 @@ from ninja_extra import (
 from ninja_extra.pagination import PageNumberPaginationExtra
 
 from .model import Notification
-from apps.core.api.permissions import IsAuthenticated, IsStaffOrSuperuser
-from apps.core.utils.serializers import to_iso
+from apps.core.api.permissions import IS_AUTHENTICATED, IS_STAFF_OR_SUPERUSER
 from .services import (
     get_user_notifications_flow,
     get_unread_count_flow,
@@ -23,6 +22,8 @@ from .services import (
     mark_notification_read_flow,
     mark_notifications_read_bulk_flow,
     filter_notifications_flow,
+    paginate_notifications_flow,
+    iter_notifications_flow,
     get_admin_unread_count_flow,
     get_notification_stats_flow,
     create_notifications_flow,
@@ -37,18 +38,11 @@ from .schemas import (
     NotificationWithRecipientOut,
     NotificationSeedSchema,
 )
-from apps.core.api.responses import ApiResponse
+from apps.core.api.responses import error_response, ndjson_response, success_response
+from apps.core.utils.pagination import count_pages
 
 
-def success_response(data=None, message="操作成功", status_code=200):
-    return ApiResponse(data=data, message=message, success=True, status_code=status_code).to_json_response()
-
-
-def error_response(message="操作失败", status_code=400, data=None):
-    return ApiResponse(data=data, message=message, success=False, status_code=status_code).to_json_response()
-
-
-@api_controller("/notifications", tags=["通知管理"], permissions=[IsAuthenticated])
+@api_controller("/notifications", tags=["通知管理"], permissions=[IS_AUTHENTICATED])
 class NotificationController(ModelControllerBase):
     """通知控制器 - 重构版"""
 
@@ -59,9 +53,8 @@ class NotificationController(ModelControllerBase):
     )
 
     def get_queryset(self):
-        """默认查询集：调用 获取"""
-        user = self.context.request.user if hasattr(self, 'context') and self.context.request.user.is_authenticated else None
-        return get_user_notifications_flow(user) if user else Notification.objects.none()
+        """默认查询集：控制器已要求登录，直接按当前用户过滤"""
+        return get_user_notifications_flow(self.context.request.user)
 
     def update(self, *args, **kwargs):
         """禁用直接更新"""
@@ -76,19 +69,13 @@ class NotificationController(ModelControllerBase):
     @route.get("/unread-count")
     def unread_count(self):
         """获取未读通知数量"""
-        user = self.context.request.user
-        if not user.is_authenticated:
-            return error_response("需要登录访问", status_code=401)
-        count = get_unread_count_flow(user)
+        count = get_unread_count_flow(self.context.request.user)
         return success_response({"count": count})
 
     @route.get("/unread")
     def unread_notifications(self, page: int = 1, page_size: int = 20):
         """获取未读通知列表"""
-        user = self.context.request.user
-        if not user.is_authenticated:
-            return error_response("需要登录访问", status_code=401)
-        queryset = get_unread_notifications_flow(user)
+        queryset = get_unread_notifications_flow(self.context.request.user)
 
         # 使用 ninja-extra 内置分页
         paginator = PageNumberPaginationExtra(page_size)
@@ -98,9 +85,7 @@ class NotificationController(ModelControllerBase):
     def mark_notification_read(self, notification_id: UUID):
         """标记通知为已读 - 内部处理权限和业务逻辑"""
         user = self.context.request.user
-        if not user.is_authenticated:
-            return error_response("需要登录访问", status_code=401)
-        success, error_msg, notification = mark_notification_read_flow(user, notification_id)
+        success, error_msg = mark_notification_read_flow(user, notification_id)
         if not success:
             return error_response(error_msg, status_code=404 if "不存在" in error_msg else 400)
         return success_response(message="通知已标记为已读")
@@ -109,8 +94,6 @@ class NotificationController(ModelControllerBase):
     def mark_notifications_read_bulk(self, payload: NotificationMarkReadBulkSchema):
         """批量标记通知为已读 - 内部处理权限和业务逻辑"""
         user = self.context.request.user
-        if not user.is_authenticated:
-            return error_response("需要登录访问", status_code=401)
         updated, error_msg = mark_notifications_read_bulk_flow(user, payload.notification_ids)
         if error_msg:
             return error_response(error_msg, status_code=400)
@@ -118,70 +101,51 @@ class NotificationController(ModelControllerBase):
 
     # ==================== 管理员接口 ====================
 
-    @route.get("/manage", permissions=[IsStaffOrSuperuser])
+    @route.get("/manage", permissions=[IS_STAFF_OR_SUPERUSER])
     def list_all_notifications(
         self,
         page: int = Query(1, ge=1),
         page_size: int = Query(20, ge=1, le=100),
         category: Optional[str] = Query(None),
         status: Optional[str] = Query(None),
-        is_read: Optional[bool] = Query(None)
+        is_read: Optional[bool] = Query(None),
+        stream: bool = Query(False, description="为真时以 NDJSON 流式导出全部结果"),
     ):
         """管理员:获取所有通知列表（带过滤）"""
         queryset = filter_notifications_flow(
             category=category,
             status=status,
             is_read=is_read,
-        ).select_related('recipient')
-
-        # 手动分页
-        from django.core.paginator import Paginator
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
-
-        # 序列化数据
-        items = []
-        for notification in page_obj:
-            items.append({
-                "id": notification.id,
-                "title": notification.title,
-                "body": notification.body,
-                "category": notification.category,
-                "priority": notification.priority,
-                "status": notification.status,
-                "is_read": notification.is_read,
-                "read_at": to_iso(notification.read_at),
-                "scheduled_for": to_iso(notification.scheduled_for),
-                "sent_role": notification.sent_role,
-                "created": to_iso(notification.created_at) if hasattr(notification, "created_at") else to_iso(getattr(notification, "created", None)),
-                "recipient_id": notification.recipient.id if notification.recipient else None,
-                "recipient_username": notification.recipient.username if notification.recipient else None,
-                "recipient_email": notification.recipient.email if notification.recipient else None,
-            })
+        )
+        if stream:
+            return ndjson_response(iter_notifications_flow(queryset))
+
+        # 单次查询分页（总数随页数据返回）
+        page_items, total, page = paginate_notifications_flow(queryset, page, page_size)
 
         return success_response({
-            "results": items,
+            "results": page_items,
             "pagination": {
-                "count": paginator.count,
+                "count": total,
                 "page": page,
                 "page_size": page_size,
-                "total_pages": paginator.num_pages,
+                "total_pages": count_pages(total, page_size),
             }
         })
 
-    @route.get("/manage/unread-count", permissions=[IsStaffOrSuperuser])
+    @route.get("/manage/unread-count", permissions=[IS_STAFF_OR_SUPERUSER])
     def admin_unread_count(self):
         """管理员：获取未读通知数量"""
         count = get_admin_unread_count_flow()
         return success_response({"count": count})
 
-    @route.get("/manage/stats", permissions=[IsStaffOrSuperuser])
+    @route.get("/manage/stats", permissions=[IS_STAFF_OR_SUPERUSER])
     def admin_stats(self):
         """管理员：通知统计"""
         stats = get_notification_stats_flow()
         return success_response(stats)
 
-    @route.post("/seed", permissions=[IsStaffOrSuperuser])
+    @route.post("/seed", permissions=[IS_STAFF_OR_SUPERUSER])
     def seed_notifications(self, payload: NotificationSeedSchema):
         """批量生成测试通知"""
         from .services import seed_notifications_service
@@ -199,8 +163,6 @@ class NotificationController(ModelControllerBase):
     def create(self, payload: NotificationCreateSchema):
         """创建通知 - 内部处理权限判断"""
         user = self.context.request.user
-        if not user.is_authenticated:
-            return error_response("需要登录访问", status_code=401)
         success, error_msg, notifications = create_notifications_flow(
             user=user,
             recipient_id=payload.recipient_id,
@@ -224,7 +186,7 @@ class NotificationController(ModelControllerBase):
             status_code=201,
         )
 
-    @route.post("/manage/{notification_id}/send", permissions=[IsStaffOrSuperuser])
+    @route.post("/manage/{notification_id}/send", permissions=[IS_STAFF_OR_SUPERUSER])
     def send_notification(self, notification_id: UUID):
         """发送通知 - 内部处理权限判断"""
         user = self.context.request.user
@@ -234,7 +196,7 @@ class NotificationController(ModelControllerBase):
             return error_response(error_msg, status_code=status_code)
         return success_response(message="通知已发送")
 
-    @route.delete("/manage/{notification_id}", permissions=[IsStaffOrSuperuser])
+    @route.delete("/manage/{notification_id}", permissions=[IS_STAFF_OR_SUPERUSER])
     def delete(self, notification_id: UUID):
         """删除通知 - 内部处理权限判断"""
         user = self.context.request.user
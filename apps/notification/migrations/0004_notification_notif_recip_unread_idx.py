@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('notification', '0003_alter_notification_options_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['recipient'], name='notif_recip_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.3 on 2026-10-16 09:40
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('notification', '0004_notification_notif_recip_unread_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at'], name='notif_recip_created_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgres(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'category', '-created_at'], name='notif_recip_cat_created_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('notification', '0005_notification_notif_recip_created_idx_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'id'], name='notif_recip_id_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-16 15:40
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('notification', '0006_notification_notif_recip_id_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['-created_at'], name='notif_admin_unread_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 """Notification models."""
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
 from model_utils import Choices
 
 from apps.core.models import BaseModel
@@ -51,15 +52,17 @@ class Notification(BaseModel):
         verbose_name = "通知"
         verbose_name_plural = "通知"
         ordering = ("-created_at",)
-
-    def mark_read(self):
-        """Mark notification as read."""
-        if not self.is_read:
-            from django.utils import timezone
-
-            self.is_read = True
-            self.read_at = timezone.now()
-            self.save(update_fields=["is_read", "read_at"])
+        indexes = [
+            # 部分索引：未读数统计只扫描未读行
+            models.Index(fields=["recipient"], name="notif_recip_unread_idx", condition=Q(is_read=False)),
+            # 管理员未读总数 / 未读列表：全表未读行按时间倒序
+            models.Index(fields=["-created_at"], name="notif_admin_unread_idx", condition=Q(is_read=False)),
+            # 用户通知列表按时间倒序分页，避免排序
+            models.Index(fields=["recipient", "-created_at"], name="notif_recip_created_idx"),
+            models.Index(fields=["recipient", "category", "-created_at"], name="notif_recip_cat_created_idx"),
+            # 按接收者 + ID 批量标记已读
+            models.Index(fields=["recipient", "id"], name="notif_recip_id_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - human readable repr
         return f"通知: {self.title} -> {self.recipient}"
@@ -53,15 +53,15 @@ class NotificationCreateSchema(Schema):
     title: str = Field(..., max_length=200, description="通知标题")
     body: str = Field(..., description="通知内容")
     category: str = Field(..., max_length=30, description="通知类别")
-    priority: Optional[Literal["low", "medium", "high"]] = Field("medium", description="通知优先级")
-    status: Optional[Literal["pending", "sent", "failed"]] = Field("pending", description="通知状态")
+    priority: Literal["low", "medium", "high"] = Field("medium", description="通知优先级")
+    status: Literal["pending", "sent", "failed"] = Field("pending", description="通知状态")
     scheduled_for: Optional[datetime] = Field(None, description="计划发送时间（可为空）")
 
 
 class NotificationMarkReadBulkSchema(Schema):
     """批量标记已读 Schema"""
 
-    notification_ids: List[UUID] = Field(..., min_items=1, description="通知ID列表")
+    notification_ids: List[UUID] = Field(..., min_items=1, max_items=1000, description="通知ID列表（单次最多 1000 条）")
 
 
 class NotificationSeedSchema(Schema):
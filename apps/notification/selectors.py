@@ -1,15 +1,41 @@
 """通知只读查询与统计。"""
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from django.contrib.auth import get_user_model
-from django.db.models import Count, QuerySet
+from django.core.cache import cache
+from django.db.models import Count, QuerySet, Window
+
+from apps.core.utils.pagination import count_pages
 
 from .model import Notification
 
 User = get_user_model()
 
+UNREAD_CACHE_PREFIX = "notif:unread:"
+# 管理员看到的是全站未读总数，所有管理员共用一个键
+UNREAD_STAFF_CACHE_KEY = f"{UNREAD_CACHE_PREFIX}staff"
+UNREAD_CACHE_TIMEOUT = 60  # 秒；所有写路径都会主动失效，TTL 只兜底绕过服务层的变更
+
+# 列表序列化所需字段（含接收者），values() 直接取字典行
+NOTIFICATION_LIST_FIELDS = (
+    "id",
+    "title",
+    "body",
+    "category",
+    "priority",
+    "status",
+    "is_read",
+    "read_at",
+    "scheduled_for",
+    "sent_role",
+    "created_at",
+    "recipient__id",
+    "recipient__username",
+    "recipient__email",
+)
+
 
 def get_notifications_queryset() -> QuerySet:
     """基础查询集：按创建时间倒序，预取接收者。"""
@@ -36,9 +62,23 @@ def get_notification_by_id(notification_id: UUID) -> Notification:
     return Notification.objects.select_related("recipient").get(id=notification_id)
 
 
-def count_unread_notifications(queryset: QuerySet) -> int:
-    """统计未读数量"""
-    return queryset.filter(is_read=False).count()
+def get_notification_summary(notification_id: UUID) -> Optional[Dict]:
+    """获取通知摘要字段（审计日志用），不实例化模型"""
+    return (
+        Notification.objects.filter(id=notification_id)
+        .values("id", "title", "status", "recipient_id", "recipient__username")
+        .first()
+    )
+
+
+def count_user_unread_notifications(user) -> int:
+    """统计用户未读数量：不 JOIN 接收者、不排序。"""
+    if not user.is_authenticated:
+        return 0
+    queryset = Notification.objects.filter(is_deleted=False, is_read=False)
+    if not (user.is_staff or user.is_superuser):
+        queryset = queryset.filter(recipient=user)
+    return queryset.count()
 
 
 def filter_notifications(
@@ -57,6 +97,58 @@ def filter_notifications(
     return queryset
 
 
+def serialize_notification_row(row: Dict) -> Dict:
+    """将 values() 字典行转换为列表输出格式（datetime 交由 orjson 直接序列化）"""
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "body": row["body"],
+        "category": row["category"],
+        "priority": row["priority"],
+        "status": row["status"],
+        "is_read": row["is_read"],
+        "read_at": row["read_at"],
+        "scheduled_for": row["scheduled_for"],
+        "sent_role": row["sent_role"],
+        "created": row["created_at"],
+        "recipient_id": row["recipient__id"],
+        "recipient_username": row["recipient__username"],
+        "recipient_email": row["recipient__email"],
+    }
+
+
+def paginate_notifications(queryset: QuerySet, page: int, page_size: int) -> Tuple[List[Dict], int, int]:
+    """
+    单次查询分页：总数通过 COUNT(*) OVER () 随当前页一并返回。
+    返回 (当前页数据, 总数, 实际页码)；页码越界时与 Paginator.get_page 一致，回退到最后一页。
+    """
+    def fetch(page_number: int) -> List[Dict]:
+        offset = (page_number - 1) * page_size
+        return list(
+            queryset.annotate(_total=Window(expression=Count("*")))
+            .values(*NOTIFICATION_LIST_FIELDS, "_total")[offset:offset + page_size]
+        )
+
+    page = max(page, 1)
+    rows = fetch(page)
+    if rows:
+        total = rows[0]["_total"]
+    else:
+        # 越界页没有数据行可携带总数，单独计数后取最后一页
+        total = queryset.count()
+        last_page = count_pages(total, page_size)
+        if page > last_page:
+            page = last_page
+            rows = fetch(page)
+    return [serialize_notification_row(row) for row in rows], total, page
+
+
+def iter_notification_rows(queryset: QuerySet, chunk_size: int = 500) -> Iterator[Dict]:
+    """按块流式读取并序列化通知，不整体载入内存"""
+    for row in queryset.values(*NOTIFICATION_LIST_FIELDS).iterator(chunk_size=chunk_size):
+        yield serialize_notification_row(row)
+
+
 def get_admin_unread_count() -> int:
     """管理员未读数量"""
     return Notification.objects.filter(is_read=False).count()
@@ -80,6 +172,18 @@ def get_notification_stats() -> Dict:
     }
 
 
+def unread_count_cache_key(user) -> str:
+    """未读数量缓存键（管理员共用全站键）"""
+    if user.is_staff or user.is_superuser:
+        return UNREAD_STAFF_CACHE_KEY
+    return f"{UNREAD_CACHE_PREFIX}{user.id}"
+
+
+def get_unread_count_from_cache(user) -> Optional[int]:
+    """从缓存读取用户未读数量（管理员读取全站共用键）"""
+    return cache.get(unread_count_cache_key(user))
+
+
 def get_all_active_users() -> List[User]:
     """获取活跃用户"""
     return list(User.objects.filter(is_active=True))
@@ -101,14 +205,24 @@ def get_user_by_id(user_id: UUID) -> User:
 
 
 __all__ = [
+    "NOTIFICATION_LIST_FIELDS",
     "get_notifications_queryset",
     "get_user_notifications",
     "get_unread_notifications",
     "get_notification_by_id",
-    "count_unread_notifications",
+    "get_notification_summary",
+    "count_user_unread_notifications",
     "filter_notifications",
+    "serialize_notification_row",
+    "paginate_notifications",
+    "iter_notification_rows",
     "get_admin_unread_count",
     "get_notification_stats",
+    "UNREAD_CACHE_PREFIX",
+    "UNREAD_STAFF_CACHE_KEY",
+    "UNREAD_CACHE_TIMEOUT",
+    "unread_count_cache_key",
+    "get_unread_count_from_cache",
     "get_all_active_users",
     "get_staff_users",
     "get_regular_users",
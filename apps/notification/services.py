@@ -1,26 +1,36 @@
 """通知业务流程（写/权限为主，读依赖 selectors）。"""
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 import random
 from faker import Faker
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import QuerySet
+from django.db.models.functions import Now
 from django.utils import timezone
 
 from .model import Notification
 from .selectors import (
-    count_unread_notifications,
+    UNREAD_CACHE_PREFIX,
+    UNREAD_CACHE_TIMEOUT,
+    UNREAD_STAFF_CACHE_KEY,
+    count_user_unread_notifications,
     filter_notifications,
     get_admin_unread_count,
     get_all_active_users,
     get_notification_by_id,
+    get_notification_summary,
     get_notification_stats,
     get_regular_users,
     get_staff_users,
+    get_unread_count_from_cache,
     get_unread_notifications,
     get_user_by_id,
     get_user_notifications,
+    iter_notification_rows,
+    paginate_notifications,
+    unread_count_cache_key,
 )
 from apps.core.api.exceptions import ValidationException
 from apps.core.api.permissions import ensure_staff_or_superuser
@@ -35,16 +45,9 @@ def _bulk_create_notifications(notifications: List[Notification]) -> List[Notifi
     return Notification.objects.bulk_create(notifications)
 
 
-def _mark_notification_read(notification: Notification) -> None:
-    """标记通知为已读"""
-    notification.is_read = True
-    notification.read_at = timezone.now()
-    notification.save(update_fields=["is_read", "read_at"])
-
-
 def _bulk_mark_notifications_read(notification_ids: List[UUID], queryset: QuerySet) -> int:
-    """批量标记通知为已读"""
-    return queryset.filter(id__in=notification_ids).update(is_read=True, read_at=timezone.now())
+    """单条 UPDATE 批量标记通知为已读，已读行不重复写入（保留原 read_at），返回实际更新数"""
+    return queryset.filter(id__in=notification_ids, is_read=False).update(is_read=True, read_at=Now())
 
 
 def _update_notification_status(notification: Notification, status: str) -> None:
@@ -53,9 +56,10 @@ def _update_notification_status(notification: Notification, status: str) -> None
     notification.save(update_fields=["status"])
 
 
-def _delete_notification(notification: Notification) -> None:
-    """删除通知"""
-    notification.delete()
+def _delete_notification(notification_id: UUID) -> int:
+    """按主键直接删除通知"""
+    deleted, _ = Notification.objects.filter(id=notification_id).delete()
+    return deleted
 
 
 def can_access_notification_flow(user, notification: Notification) -> Tuple[bool, Optional[str]]:
@@ -78,15 +82,30 @@ def can_manage_notifications_flow(user) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+def set_unread_count_to_cache(user, count: int) -> None:
+    """写入用户未读数量缓存"""
+    cache.set(unread_count_cache_key(user), count, UNREAD_CACHE_TIMEOUT)
+
+
+def clear_unread_count_cache(*user_ids) -> None:
+    """清除指定用户的未读数量缓存；任何未读数变化都会影响全站总数，管理员共用键一并清除"""
+    keys = [f"{UNREAD_CACHE_PREFIX}{user_id}" for user_id in user_ids if user_id]
+    cache.delete_many([*keys, UNREAD_STAFF_CACHE_KEY])
+
+
 def get_user_notifications_flow(user) -> QuerySet:
     """获取用户通知列表流程"""
     return get_user_notifications(user)
 
 
 def get_unread_count_flow(user) -> int:
-    """获取未读通知数量流程"""
-    queryset = get_user_notifications(user)
-    return count_unread_notifications(queryset)
+    """获取未读通知数量流程（短 TTL 缓存，写操作时主动失效）"""
+    cached = get_unread_count_from_cache(user)
+    if cached is not None:
+        return cached
+    count = count_user_unread_notifications(user)
+    set_unread_count_to_cache(user, count)
+    return count
 
 
 def get_unread_notifications_flow(user) -> QuerySet:
@@ -94,21 +113,26 @@ def get_unread_notifications_flow(user) -> QuerySet:
     return get_unread_notifications(user)
 
 
-def mark_notification_read_flow(user, notification_id: UUID) -> Tuple[bool, Optional[str], Optional[Notification]]:
-    """标记通知为已读流程"""
-    queryset = get_user_notifications(user)
-    try:
-        notification = queryset.get(id=notification_id)
-    except Notification.DoesNotExist:
-        return False, "通知不存在", None
-    _mark_notification_read(notification)
-    return True, None, notification
+def mark_notification_read_flow(user, notification_id: UUID) -> Tuple[bool, Optional[str]]:
+    """标记通知为已读流程：复用批量路径，未命中时再区分不存在与已读"""
+    updated, _ = mark_notifications_read_bulk_flow(user, [notification_id])
+    if not updated and not get_user_notifications(user).filter(id=notification_id).exists():
+        return False, "通知不存在"
+    return True, None
 
 
 def mark_notifications_read_bulk_flow(user, notification_ids: List[UUID]) -> Tuple[int, Optional[str]]:
     """批量标记通知为已读流程"""
     queryset = get_user_notifications(user)
+    affected_user_ids = [user.id]
+    if user.is_staff or user.is_superuser:
+        # 管理员可标记他人通知，需要同时失效接收者的缓存
+        affected_user_ids.extend(
+            queryset.filter(id__in=notification_ids).values_list("recipient_id", flat=True).distinct()
+        )
     updated = _bulk_mark_notifications_read(notification_ids, queryset)
+    if updated:
+        clear_unread_count_cache(*affected_user_ids)
     return updated, None
 
 
@@ -121,6 +145,16 @@ def filter_notifications_flow(
     return filter_notifications(category=category, status=status, is_read=is_read)
 
 
+def paginate_notifications_flow(queryset: QuerySet, page: int, page_size: int) -> Tuple[List[Dict], int, int]:
+    """分页通知列表流程，返回当前页数据、总数与实际页码（越界回退到最后一页）"""
+    return paginate_notifications(queryset, page, page_size)
+
+
+def iter_notifications_flow(queryset: QuerySet) -> Iterator[Dict]:
+    """流式导出通知列表流程"""
+    return iter_notification_rows(queryset)
+
+
 def get_admin_unread_count_flow() -> int:
     """获取管理员未读通知数量流程"""
     return get_admin_unread_count()
@@ -143,16 +177,11 @@ def create_notifications_flow(
     scheduled_for: Optional[datetime],
     request,
 ) -> Tuple[bool, Optional[str], Optional[List[Notification]]]:
-    """创建通知流程"""
+    """创建通知流程（priority/status 已由 NotificationCreateSchema 的 Literal 校验）"""
     can_manage, error_msg = can_manage_notifications_flow(user)
     if not can_manage:
         return False, error_msg, None
 
-    if priority not in Notification.PRIORITY:
-        return False, "无效的通知优先级", None
-    if status not in Notification.STATUS:
-        return False, "无效的通知状态", None
-
     recipients: List[User] = []
     if recipient_role:
         if recipient_role == "all":
@@ -191,6 +220,7 @@ def create_notifications_flow(
         for r in recipients
     ]
     created_notifications = _bulk_create_notifications(notifications)
+    clear_unread_count_cache(*{r.id for r in recipients})
 
     log_notification_action(
         action="创建通知",
@@ -265,6 +295,7 @@ def seed_notifications_service(
         )
 
     created_notifications = _bulk_create_notifications(notifications)
+    clear_unread_count_cache(*{n.recipient_id for n in created_notifications})
 
     log_notification_action(
         action="批量生成通知",
@@ -323,25 +354,25 @@ def delete_notification_flow(user: User, notification_id: UUID, request) -> Tupl
     if not can_manage:
         return False, error_msg
 
-    try:
-        notification = get_notification_by_id(notification_id)
-    except Notification.DoesNotExist:
+    # 审计日志只需摘要字段，读取字典行后按主键直接删除
+    summary = get_notification_summary(notification_id)
+    if summary is None or not _delete_notification(notification_id):
         return False, "通知不存在"
 
     log_notification_action(
         action="删除通知",
-        message=f"用户 {user.username} 删除了通知：{notification.title}",
+        message=f"用户 {user.username} 删除了通知：{summary['title']}",
         user=user,
         request=request,
         extra_data={
-            "notification_id": notification.id,
-            "title": notification.title,
-            "recipient": notification.recipient.username if notification.recipient else None,
-            "status": notification.status,
+            "notification_id": summary["id"],
+            "title": summary["title"],
+            "recipient": summary["recipient__username"],
+            "status": summary["status"],
         },
     )
 
-    _delete_notification(notification)
+    clear_unread_count_cache(summary["recipient_id"])
     return True, None
 
 
@@ -352,6 +383,8 @@ __all__ = [
     "mark_notification_read_flow",
     "mark_notifications_read_bulk_flow",
     "filter_notifications_flow",
+    "paginate_notifications_flow",
+    "iter_notifications_flow",
     "get_admin_unread_count_flow",
     "get_notification_stats_flow",
     "create_notifications_flow",
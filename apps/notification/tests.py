@@ -0,0 +1,54 @@
+"""通知应用测试。"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from .model import Notification
+from .services import get_unread_count_flow, mark_notification_read_flow, mark_notifications_read_bulk_flow
+
+User = get_user_model()
+
+
+class UnreadCountCacheTests(TestCase):
+    """未读数缓存：命中不查库，写操作后用户与管理员的缓存都失效。"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="bob", email="bob@example.com", password="pw")
+        cls.staff = User.objects.create_user(username="admin", email="admin@example.com", password="pw", is_staff=True)
+        cls.notifications = Notification.objects.bulk_create(
+            Notification(recipient=cls.user, title=f"t{i}", body="b", category="系统") for i in range(3)
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_second_read_is_served_from_cache(self):
+        self.assertEqual(get_unread_count_flow(self.user), 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_unread_count_flow(self.user), 3)
+
+    def test_mark_read_invalidates_recipient(self):
+        self.assertEqual(get_unread_count_flow(self.user), 3)
+
+        ok, _ = mark_notification_read_flow(self.user, self.notifications[0].id)
+
+        self.assertTrue(ok)
+        self.assertEqual(get_unread_count_flow(self.user), 2)
+
+    def test_recipient_change_invalidates_staff_total(self):
+        self.assertEqual(get_unread_count_flow(self.staff), 3)
+
+        updated, _ = mark_notifications_read_bulk_flow(self.user, [n.id for n in self.notifications[:2]])
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(get_unread_count_flow(self.staff), 1)
+
+    def test_already_read_rows_are_not_rewritten(self):
+        mark_notification_read_flow(self.user, self.notifications[0].id)
+        read_at = Notification.objects.get(pk=self.notifications[0].pk).read_at
+
+        updated, _ = mark_notifications_read_bulk_flow(self.user, [self.notifications[0].id])
+
+        self.assertEqual(updated, 0)
+        self.assertEqual(Notification.objects.get(pk=self.notifications[0].pk).read_at, read_at)
@@ -4,14 +4,13 @@ import psutil
 from typing import Optional
 from uuid import UUID
 
-from captcha.helpers import captcha_image_url
 from captcha.models import CaptchaStore
 from ninja import File, Query, Router
 from ninja.files import UploadedFile
 from ninja_extra import ControllerBase, api_controller, http_delete, http_get, http_put
 
-from apps.core.api.permissions import IsStaffOrSuperuser
-from apps.core.api.responses import error_response, success_response
+from apps.core.api.permissions import IS_STAFF_OR_SUPERUSER
+from apps.core.api.responses import error_response, ndjson_response, success_response
 from .schemas import (
     AdminCreateUserSchema,
     CaptchaVerifySchema,
@@ -30,6 +29,8 @@ from .services import (
     get_dashboard_data,
     get_profile,
     get_user_detail,
+    issue_captcha,
+    iter_users,
     list_user_activities,
     list_users,
     login_user,
@@ -101,14 +102,8 @@ def _create_profile_router() -> Router:
     def change_password_page(request):
         if not request.user.is_authenticated:
             return error_response(message="需要登录访问", status_code=401)
-        captcha_key = CaptchaStore.pick()
-        captcha_image_url_path = captcha_image_url(captcha_key)
         return success_response(
-            data={
-                "message": "请通过POST方法修改密码",
-                "captcha_key": captcha_key,
-                "captcha_image_url": captcha_image_url_path,
-            },
+            data={"message": "请通过POST方法修改密码", **issue_captcha()},
             message="获取成功",
         )
 
@@ -130,8 +125,16 @@ def _create_profile_router() -> Router:
         return success_response(data={"avatar_url": avatar_url}, message="头像上传成功")
 
     @router.get("/user/activities")
-    def user_activities_api(request, page: int = 1, page_size: int = 10, activity_type: Optional[str] = Query(None)):
-        payload = list_user_activities(request.user, page=page, page_size=page_size, activity_type=activity_type)
+    def user_activities_api(
+        request,
+        page: int = 1,
+        page_size: int = 10,
+        activity_type: Optional[str] = Query(None),
+        cursor: Optional[str] = Query(None, description="游标分页：首页传空串，之后传上次返回的 next_cursor"),
+    ):
+        payload = list_user_activities(
+            request.user, page=page, page_size=page_size, activity_type=activity_type, cursor=cursor
+        )
         return success_response(data=payload, message="获取活动记录成功")
 
     @router.post("/user/update-profile")
@@ -163,14 +166,8 @@ def _create_captcha_router() -> Router:
 
     @router.get("/captcha/generate")
     def generate_captcha(request):
-        captcha_key = CaptchaStore.pick()
-        captcha_image_url_path = captcha_image_url(captcha_key)
         return success_response(
-            data={
-                "captcha_key": captcha_key,
-                "captcha_image_url": captcha_image_url_path,
-                "expires_in": 300,
-            },
+            data=issue_captcha(),
             message="验证码生成成功",
         )
 
@@ -199,8 +196,17 @@ def _create_admin_router() -> Router:
         return success_response(data=data, message="获取管理数据成功")
 
     @router.get("/manage/users")
-    def list_users_api(request, page: int = 1, page_size: int = 10, search: Optional[str] = None):
-        data = list_users(request.user, page, page_size, search)
+    def list_users_api(
+        request,
+        page: int = 1,
+        page_size: int = 10,
+        search: Optional[str] = None,
+        cursor: Optional[str] = Query(None, description="游标分页：首页传空串，之后传上次返回的 next_cursor"),
+        stream: bool = Query(False, description="为真时以 NDJSON 流式导出全部结果"),
+    ):
+        if stream:
+            return ndjson_response(iter_users(request.user, search))
+        data = list_users(request.user, page, page_size, search, cursor=cursor)
         return success_response(data=data, message="获取用户列表成功")
 
     @router.post("/manage/users")
@@ -250,7 +256,7 @@ def _create_admin_router() -> Router:
 
 
 # ====== ninja-extra Controller（保留文档/兼容） ======
-@api_controller("/manage", tags=["管理后台"], permissions=[IsStaffOrSuperuser])
+@api_controller("/manage", tags=["管理后台"], permissions=[IS_STAFF_OR_SUPERUSER])
 class AdminExtraController(ControllerBase):
     """管理后台纯查询/统计接口。"""
 
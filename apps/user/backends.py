@@ -0,0 +1,24 @@
+"""认证后端：会话用户连同资料一次 JOIN 取出。"""
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+UserModel = get_user_model()
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    在 ModelBackend 基础上 select_related 资料，个人中心等接口访问 user.profile 无需再查。
+    不缓存用户对象：is_active、权限标记与密码哈希每次请求都从数据库读取，停用/降权即时生效。
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = UserModel._default_manager.select_related("profile").get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+__all__ = ["ProfileModelBackend"]
@@ -0,0 +1,34 @@
+"""列出（并可选清理）被多个未删除用户使用的邮箱。"""
+from django.core.management.base import BaseCommand
+
+from apps.user.selectors import get_duplicate_active_emails
+from apps.user.services import clear_duplicate_active_emails
+
+
+class Command(BaseCommand):
+    help = "列出被多个未删除用户使用的邮箱；加 --clear-later-accounts 时仅保留最早注册账号的邮箱"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clear-later-accounts",
+            action="store_true",
+            help="将重复邮箱中除最早注册账号外的其余账号邮箱置空",
+        )
+
+    def handle(self, *args, **options):
+        duplicates = get_duplicate_active_emails()
+        if not duplicates:
+            self.stdout.write(self.style.SUCCESS("没有重复邮箱"))
+            return
+
+        for email, rows in duplicates.items():
+            users = "，".join(f"{row['username']}（{row['date_joined']:%Y-%m-%d %H:%M}）" for row in rows)
+            self.stdout.write(f"{email}: {users}")
+
+        if not options["clear_later_accounts"]:
+            self.stdout.write(self.style.WARNING(f"共 {len(duplicates)} 个重复邮箱，确认后加 --clear-later-accounts 清理"))
+            return
+
+        cleared = clear_duplicate_active_emails()
+        total = sum(len(names) for names in cleared.values())
+        self.stdout.write(self.style.SUCCESS(f"已清空 {total} 个账号的重复邮箱"))
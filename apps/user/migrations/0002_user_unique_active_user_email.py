@@ -0,0 +1,38 @@
+# Generated by Django 5.0.3 on 2026-10-16 11:20
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_active_emails(apps, schema_editor):
+    """建约束前检查：存在重复邮箱的未删除用户时中止迁移，由管理员先行处理，不在迁移中改动数据。"""
+    User = apps.get_model('user', 'User')
+    duplicated = list(
+        User.objects.filter(is_deleted=False)
+        .exclude(email='')
+        .values_list('email', flat=True)
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+        .order_by('email')
+    )
+    if duplicated:
+        raise RuntimeError(
+            '以下邮箱被多个未删除用户使用，无法添加唯一约束 unique_active_user_email：'
+            f"{', '.join(duplicated)}。"
+            '请先执行 `python manage.py find_duplicate_user_emails` 查看并处理后再迁移。'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_active_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False), models.Q(('email', ''), _negated=True)), fields=('email',), name='unique_active_user_email'),
+        ),
+    ]
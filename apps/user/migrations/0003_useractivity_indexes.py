@@ -0,0 +1,25 @@
+# Generated by Django 5.0.3 on 2026-10-16 12:10
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    # user_useractivity 为持续增长的审计表，PostgreSQL 上并发建索引避免锁表
+    atomic = False
+
+    dependencies = [
+        ('user', '0002_user_unique_active_user_email'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='useractivity',
+            index=models.Index(fields=['user', '-created_at'], name='act_user_created_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgres(
+            model_name='useractivity',
+            index=models.Index(fields=['activity_type', '-created_at'], name='act_type_created_idx'),
+        ),
+    ]
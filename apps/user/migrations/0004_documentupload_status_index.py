@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-16 12:30
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('user', '0003_useractivity_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='documentupload',
+            index=models.Index(fields=['status', '-created_at'], name='doc_status_created_idx'),
+        ),
+    ]
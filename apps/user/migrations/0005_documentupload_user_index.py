@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-16 13:05
+
+from django.db import migrations, models
+
+from apps.core.utils.migration_ops import AddIndexConcurrentlyIfPostgres
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('user', '0004_documentupload_status_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name='documentupload',
+            index=models.Index(fields=['user', '-created_at'], name='doc_user_created_idx'),
+        ),
+    ]
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import os
 import uuid
-from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, UserManager
@@ -48,6 +47,14 @@ class User(BaseModel, AbstractUser):
     class Meta(BaseModel.Meta):
         verbose_name = "用户"
         verbose_name_plural = "用户"
+        constraints = [
+            # 未删除用户的非空邮箱唯一，注册/编辑时直接依赖该约束判重
+            models.UniqueConstraint(
+                fields=["email"],
+                condition=models.Q(is_deleted=False) & ~models.Q(email=""),
+                name="unique_active_user_email",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.get_username()
@@ -98,10 +105,17 @@ class UserProfile(BaseModel):
         return f"资料 - {self.user.username}"
 
     def update_login_stats(self) -> None:
-        """更新登录次数与最后活动时间。"""
+        """更新登录次数与最后活动时间：单条原子 UPDATE，并发登录不会丢失计数。"""
+        now = timezone.now()
+        UserProfile.objects.filter(pk=self.pk).update(
+            login_count=models.F("login_count") + 1,
+            last_activity=now,
+            updated_at=now,
+        )
+        # 同步内存中的值（近似值，不回读数据库）
         self.login_count += 1
-        self.last_activity = timezone.now()
-        self.save(update_fields=["login_count", "last_activity", "updated_at"])
+        self.last_activity = now
+        self.updated_at = now
 
     def delete_avatar(self) -> None:
         """删除头像文件并清空字段。"""
@@ -123,6 +137,8 @@ class UserActivity(BaseModel):
         ("avatar_upload", "上传头像"),
         ("admin_action", "管理操作"),
     )
+    # 类型 -> 显示名，按 key 直接查表
+    ACTIVITY_LABELS = dict(ACTIVITY_TYPES)
 
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -139,9 +155,15 @@ class UserActivity(BaseModel):
     class Meta(BaseModel.Meta):
         verbose_name = "用户活动"
         verbose_name_plural = "用户活动"
+        indexes = [
+            # 个人活动列表：按用户过滤、按时间倒序分页
+            models.Index(fields=["user", "-created_at"], name="act_user_created_idx"),
+            # 仪表盘：按类型统计当日活动
+            models.Index(fields=["activity_type", "-created_at"], name="act_type_created_idx"),
+        ]
 
     def __str__(self) -> str:
-        return f"{self.user.username} - {self.get_activity_type_display()}"
+        return f"{self.user.username} - {self.ACTIVITY_LABELS.get(self.activity_type, self.activity_type)}"
 
 
 class DocumentUpload(BaseModel):
@@ -185,6 +207,12 @@ class DocumentUpload(BaseModel):
     class Meta(BaseModel.Meta):
         verbose_name = "文档上传"
         verbose_name_plural = "文档上传"
+        indexes = [
+            # 审核列表：按状态过滤、按时间倒序
+            models.Index(fields=["status", "-created_at"], name="doc_status_created_idx"),
+            # 个人文档列表：按上传用户过滤、按时间倒序
+            models.Index(fields=["user", "-created_at"], name="doc_user_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user.username} - {self.file_name}"
@@ -5,7 +5,7 @@ from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, ValidationInfo, field_validator
 
 
 # ==== 认证 ====
@@ -13,7 +13,8 @@ class UserLoginSchema(BaseModel):
     username: str
     password: str
 
-    @validator("username", "password")
+    @field_validator("username", "password")
+    @classmethod
     def not_empty(cls, v: str) -> str:
         if not v or not v.strip():
             raise ValueError("字段不能为空")
@@ -32,37 +33,43 @@ class UserRegisterSchema(BaseModel):
     birth_date: Optional[str] = None
     phone: Optional[str] = None
 
-    @validator("username", "password1", "password2")
+    @field_validator("username", "password1", "password2")
+    @classmethod
     def not_empty(cls, v: str) -> str:
         if not v or not v.strip():
             raise ValueError("字段不能为空")
         return v.strip()
 
-    @validator("password2")
-    def passwords_match(cls, v: str, values):
-        if "password1" in values and v != values["password1"]:
+    @field_validator("password2")
+    @classmethod
+    def passwords_match(cls, v: str, info: ValidationInfo):
+        if "password1" in info.data and v != info.data["password1"]:
             raise ValueError("两次输入的密码不一致")
         return v
 
-    @validator("password1")
+    @field_validator("password1")
+    @classmethod
     def password_strength(cls, v: str):
         if len(v) < 8:
             raise ValueError("密码长度不能少于8个字符")
         return v
 
-    @validator("nickname", "phone", pre=True)
+    @field_validator("nickname", "phone", mode="before")
+    @classmethod
     def strip_optional(cls, v):
         if v is None:
             return v
         return v.strip() or None
 
-    @validator("gender")
+    @field_validator("gender")
+    @classmethod
     def gender_choices(cls, v):
         if v and v not in ["male", "female", "other", "prefer_not_to_say"]:
             raise ValueError("性别选项无效")
         return v
 
-    @validator("birth_date")
+    @field_validator("birth_date")
+    @classmethod
     def birth_date_format(cls, v):
         if v:
             try:
@@ -80,19 +87,22 @@ class ChangePasswordSchema(BaseModel):
     captcha: Optional[str] = None
     captcha_key: Optional[str] = None
 
-    @validator("old_password", "new_password1", "new_password2")
+    @field_validator("old_password", "new_password1", "new_password2")
+    @classmethod
     def not_empty(cls, v: str) -> str:
         if not v or not v.strip():
             raise ValueError("密码不能为空")
         return v
 
-    @validator("new_password2")
-    def new_passwords_match(cls, v: str, values):
-        if "new_password1" in values and v != values["new_password1"]:
+    @field_validator("new_password2")
+    @classmethod
+    def new_passwords_match(cls, v: str, info: ValidationInfo):
+        if "new_password1" in info.data and v != info.data["new_password1"]:
             raise ValueError("两次输入的新密码不一致")
         return v
 
-    @validator("new_password1")
+    @field_validator("new_password1")
+    @classmethod
     def password_strength(cls, v: str):
         if len(v) < 8:
             raise ValueError("新密码长度不能少于8个字符")
@@ -105,13 +115,15 @@ class UserProfileUpdateSchema(BaseModel):
     gender: Optional[str] = None
     birth_date: Optional[date] = None
 
-    @validator("phone", "nickname", pre=True)
+    @field_validator("phone", "nickname", mode="before")
+    @classmethod
     def strip_optional(cls, v):
         if v is None:
             return v
         return v.strip() or None
 
-    @validator("gender")
+    @field_validator("gender")
+    @classmethod
     def gender_choices(cls, v):
         if v and v not in ["male", "female", "other", "prefer_not_to_say"]:
             raise ValueError("性别选项无效")
@@ -127,19 +139,22 @@ class AdminCreateUserSchema(BaseModel):
     is_active: Optional[bool] = True
     is_staff: Optional[bool] = False
 
-    @validator("username")
+    @field_validator("username")
+    @classmethod
     def username_not_empty(cls, v: str):
         if not v or not v.strip():
             raise ValueError("用户名不能为空")
         return v.strip()
 
-    @validator("password")
+    @field_validator("password")
+    @classmethod
     def password_strength(cls, v: str):
         if not v or len(v) < 8:
             raise ValueError("密码长度不能少于8个字符")
         return v
 
-    @validator("nickname", pre=True)
+    @field_validator("nickname", mode="before")
+    @classmethod
     def strip_nickname(cls, v):
         if v is None:
             return v
@@ -153,13 +168,15 @@ class UserUpdateSchema(BaseModel):
     is_staff: Optional[bool] = None
     password: Optional[str] = None
 
-    @validator("password")
+    @field_validator("password")
+    @classmethod
     def password_strength(cls, v: Optional[str]):
         if v and len(v) < 8:
             raise ValueError("密码长度不能少于8个字符")
         return v
 
-    @validator("nickname", pre=True)
+    @field_validator("nickname", mode="before")
+    @classmethod
     def strip_nickname(cls, v):
         if v is None:
             return v
@@ -171,7 +188,8 @@ class CaptchaVerifySchema(BaseModel):
     captcha: str
     captcha_key: str
 
-    @validator("captcha", "captcha_key")
+    @field_validator("captcha", "captcha_key")
+    @classmethod
     def not_empty(cls, v: str):
         if not v or not v.strip():
             raise ValueError("字段不能为空")
@@ -184,7 +202,8 @@ class SeedUserSchema(BaseModel):
     default_password: str = Field("123456", min_length=1, description="生成用户的默认密码")
     role_id: Optional[UUID] = Field(None, description="可选角色ID，为生成用户分配角色")
 
-    @validator("default_password")
+    @field_validator("default_password")
+    @classmethod
     def password_not_blank(cls, v: str):
         if not v or not v.strip():
             raise ValueError("默认密码不能为空")
@@ -1,11 +1,12 @@
 """用户模块只读查询与校验。"""
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Optional, Tuple
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
 from django.db.models import Count, Q, QuerySet
 from django.db.models.functions import TruncDate
 from django.core.paginator import Paginator
@@ -16,6 +17,25 @@ from .model import Role, UserActivity, UserProfile
 
 User = get_user_model()
 
+# 列表接口实际输出的字段，避免取出 password、user_agent 等宽列；用户列表以 values() 取字典行
+USER_LIST_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "is_active",
+    "is_staff",
+    "date_joined",
+    "created_at",
+    "profile__nickname",
+    "profile__login_count",
+)
+ACTIVITY_LIST_FIELDS = ("id", "activity_type", "description", "ip_address", "created_at")
+# 活动类型显示名，列表按 key 直接查表
+ACTIVITY_LABELS = UserActivity.ACTIVITY_LABELS
+
+DASHBOARD_CACHE_PREFIX = "admin:dash:"
+DASHBOARD_CACHE_TIMEOUT = 60  # 秒
+
 
 # 基础查询
 def base_user_queryset() -> QuerySet:
@@ -35,6 +55,43 @@ def check_user_exists_by_email(email: str) -> bool:
     return base_user_queryset().filter(email=email).exists()
 
 
+def get_taken_usernames_and_emails(usernames: Iterable[str], emails: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+    """
+    一次查询返回候选中已被占用的用户名与邮箱。
+    用户名唯一约束包含已软删除的用户；邮箱只与未删除用户冲突。
+    """
+    usernames, emails = list(usernames), list(emails)
+    rows = User.objects.filter(
+        Q(username__in=usernames) | Q(email__in=emails, is_deleted=False)
+    ).values_list("username", "email", "is_deleted")
+    username_set, email_set = set(usernames), set(emails)
+    taken_usernames: Set[str] = set()
+    taken_emails: Set[str] = set()
+    for username, email, is_deleted in rows:
+        if username in username_set:
+            taken_usernames.add(username)
+        if not is_deleted and email in email_set:
+            taken_emails.add(email)
+    return taken_usernames, taken_emails
+
+
+def get_duplicate_active_emails() -> Dict[str, List[dict]]:
+    """被多个未删除用户使用的非空邮箱 -> 这些用户（按注册时间升序）。"""
+    active = User.objects.filter(is_deleted=False).exclude(email="")
+    emails = (
+        active.values_list("email", flat=True)
+        .annotate(n=Count("id"))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    duplicates: Dict[str, List[dict]] = {}
+    for row in active.filter(email__in=emails).order_by("email", "date_joined", "id").values(
+        "id", "username", "email", "date_joined"
+    ):
+        duplicates.setdefault(row["email"], []).append(row)
+    return duplicates
+
+
 def get_user_by_id(user_id: UUID):
     return base_user_queryset().filter(id=user_id).first()
 
@@ -55,7 +112,8 @@ def is_nickname_taken(nickname: str, exclude_user_id: Optional[UUID] = None) ->
 
 
 def get_user_activities(user, activity_type: Optional[str] = None) -> QuerySet:
-    qs = UserActivity.objects.filter(user=user, is_deleted=False).order_by("-created_at")
+    """活动记录查询：返回 values() 字典行。"""
+    qs = UserActivity.objects.filter(user=user, is_deleted=False).values(*ACTIVITY_LIST_FIELDS).order_by("-created_at")
     if activity_type:
         qs = qs.filter(activity_type=activity_type)
     return qs
@@ -68,7 +126,8 @@ def paginate_queryset(qs: QuerySet, page: int, page_size: int) -> Tuple[list, in
 
 
 def filter_users(search: Optional[str] = None) -> QuerySet:
-    qs = base_user_queryset().select_related("profile").order_by("-created_at")
+    """用户列表查询：直接返回 values() 字典行（资料字段经 JOIN 取出），不实例化模型。"""
+    qs = base_user_queryset().values(*USER_LIST_FIELDS).order_by("-created_at")
     if search:
         qs = qs.filter(
             Q(username__icontains=search)
@@ -79,26 +138,43 @@ def filter_users(search: Optional[str] = None) -> QuerySet:
 
 
 def get_admin_dashboard_metrics() -> dict:
-    today = timezone.now().date()
-    total_users = base_user_queryset().count()
-    staff_users = base_user_queryset().filter(is_staff=True).count()
-    active_users = base_user_queryset().filter(is_active=True).count()
-    new_users_today = base_user_queryset().filter(created_at__date=today).count()
-    activities_today = UserActivity.objects.filter(created_at__date=today, is_deleted=False).count()
-    logins_today = UserActivity.objects.filter(
-        activity_type="login", created_at__date=today, is_deleted=False
-    ).count()
+    """仪表盘统计：用户表与活动表各一次条件聚合。"""
+    # 以当日时间范围代替 __date 查找，使 created_at 上的索引可用于范围扫描
+    today_start = timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+    today_range = (today_start, today_start + timedelta(days=1))
+    user_stats = base_user_queryset().aggregate(
+        total=Count("id"),
+        staff=Count("id", filter=Q(is_staff=True)),
+        active=Count("id", filter=Q(is_active=True)),
+        new_today=Count("id", filter=Q(created_at__gte=today_range[0], created_at__lt=today_range[1])),
+    )
+    activity_stats = UserActivity.objects.filter(
+        created_at__gte=today_range[0], created_at__lt=today_range[1], is_deleted=False
+    ).aggregate(
+        total=Count("id"),
+        logins=Count("id", filter=Q(activity_type="login")),
+    )
     return {
-        "total_users": total_users,
-        "active_users": active_users,
-        "staff_users": staff_users,
-        "regular_users": total_users - staff_users,
-        "new_users_today": new_users_today,
-        "activities_today": activities_today,
-        "logins_today": logins_today,
+        "total_users": user_stats["total"],
+        "active_users": user_stats["active"],
+        "staff_users": user_stats["staff"],
+        "regular_users": user_stats["total"] - user_stats["staff"],
+        "new_users_today": user_stats["new_today"],
+        "activities_today": activity_stats["total"],
+        "logins_today": activity_stats["logins"],
     }
 
 
+def dashboard_cache_key() -> str:
+    """当日仪表盘统计缓存键。"""
+    return f"{DASHBOARD_CACHE_PREFIX}{timezone.localdate().isoformat()}"
+
+
+def get_dashboard_from_cache() -> Optional[dict]:
+    """读取当日仪表盘统计缓存。"""
+    return cache.get(dashboard_cache_key())
+
+
 def get_dashboard_chart_series(days: int = 30) -> dict:
     end_date = timezone.now().date()
     start_date = end_date - timedelta(days=days)
@@ -239,14 +315,20 @@ __all__ = [
     "authenticate_user",
     "check_user_exists_by_email",
     "check_user_exists_by_username",
+    "get_taken_usernames_and_emails",
+    "get_duplicate_active_emails",
     "get_user_by_id",
     "get_user_with_profile",
     "verify_password",
     "is_nickname_taken",
+    "ACTIVITY_LABELS",
     "get_user_activities",
     "paginate_queryset",
     "filter_users",
     "get_admin_dashboard_metrics",
+    "DASHBOARD_CACHE_TIMEOUT",
+    "dashboard_cache_key",
+    "get_dashboard_from_cache",
     "get_dashboard_chart_series",
     "get_dashboard_plotly_data",
     "serialize_user",
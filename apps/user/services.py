@@ -2,27 +2,42 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+from captcha.conf import settings as captcha_settings
+from captcha.helpers import captcha_image_url
 from captcha.models import CaptchaStore
 from django.contrib.auth import get_user_model, login, logout
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from faker import Faker
 
-from apps.core.api.exceptions import BusinessException, NotFoundException, ValidationException
+from apps.core.api.exceptions import (
+    BusinessException,
+    NotFoundException,
+    PermissionException,
+    ValidationException,
+)
 from apps.core.api.permissions import ensure_authenticated, ensure_staff_or_superuser, ensure_superuser
-from apps.core.utils.serializers import to_iso
+from apps.core.utils.background import BackgroundBatchWriter
+from apps.core.utils.pagination import keyset_paginate
 from apps.log.model import Log
 from apps.log.services import log_admin_action, log_auth_action, log_user_action
 from .model import Role, UserActivity, UserProfile, UserRole
 from .selectors import (
+    ACTIVITY_LABELS,
+    DASHBOARD_CACHE_TIMEOUT,
     authenticate_user,
-    check_user_exists_by_email,
-    check_user_exists_by_username,
+    dashboard_cache_key,
     filter_users,
     get_admin_dashboard_metrics,
     get_dashboard_chart_series,
+    get_dashboard_from_cache,
     get_dashboard_plotly_data,
+    get_duplicate_active_emails,
+    get_taken_usernames_and_emails,
     get_user_activities,
     get_user_by_id,
     get_user_with_profile,
@@ -36,6 +51,56 @@ User = get_user_model()
 faker = Faker("zh_CN")
 
 
+def set_dashboard_to_cache(data: Dict[str, Any]) -> None:
+    """写入当日仪表盘统计缓存。"""
+    cache.set(dashboard_cache_key(), data, DASHBOARD_CACHE_TIMEOUT)
+
+
+def clear_dashboard_cache() -> None:
+    """清除当日仪表盘统计缓存（用户数据变更后调用）。"""
+    cache.delete(dashboard_cache_key())
+
+
+def _bulk_create_activities(activities: List[UserActivity]) -> None:
+    # 主键在入队时已生成，重复提交的同一批次按冲突忽略，不会让整批写入失败
+    UserActivity.objects.bulk_create(activities, ignore_conflicts=True)
+
+
+# 活动记录属于审计数据，交由后台线程批量写入，不占用请求耗时
+_activity_writer = BackgroundBatchWriter(_bulk_create_activities, name="user-activity-writer")
+
+
+def _record_activity(request, user, activity_type: str, description: str) -> None:
+    """异步记录用户活动。"""
+    _activity_writer.submit(
+        UserActivity(
+            user=user,
+            activity_type=activity_type,
+            description=description,
+            ip_address=request.META.get("REMOTE_ADDR", ""),
+            user_agent=request.META.get("HTTP_USER_AGENT", ""),
+        )
+    )
+
+
+EMAIL_UNIQUE_CONSTRAINT = "unique_active_user_email"
+
+
+def _is_email_conflict(exc: IntegrityError) -> bool:
+    """按约束名判断是否为邮箱唯一约束冲突；sqlite 报错不带约束名，退回匹配 表.列。"""
+    diag = getattr(exc.__cause__, "diag", None)
+    constraint_name = getattr(diag, "constraint_name", None)
+    if constraint_name:
+        return constraint_name == EMAIL_UNIQUE_CONSTRAINT
+    message = str(exc)
+    return EMAIL_UNIQUE_CONSTRAINT in message or f"{User._meta.db_table}.email" in message
+
+
+def _duplicate_user_message(exc: IntegrityError, email_message: str) -> str:
+    """根据触发的唯一约束（用户名 / 邮箱）返回提示。"""
+    return email_message if _is_email_conflict(exc) else "用户名已存在"
+
+
 # ====== 认证 ======
 def login_user(request, username: str, password: str) -> Dict[str, Any]:
     user = authenticate_user(username, password)
@@ -66,13 +131,7 @@ def login_user(request, username: str, password: str) -> Dict[str, Any]:
     if profile:
         profile.update_login_stats()
 
-    UserActivity.objects.create(
-        user=user,
-        activity_type="login",
-        description=f"用户 {user.username} 登录成功",
-        ip_address=request.META.get("REMOTE_ADDR", ""),
-        user_agent=request.META.get("HTTP_USER_AGENT", ""),
-    )
+    _record_activity(request, user, "login", f"用户 {user.username} 登录成功")
 
     log_auth_action(
         action="用户登录",
@@ -96,36 +155,36 @@ def register_user(
     birth_date: Optional[str] = None,
     phone: Optional[str] = None,
 ) -> Dict[str, Any]:
-    if check_user_exists_by_username(username):
-        raise ValidationException("用户名已存在")
-    if check_user_exists_by_email(email):
-        raise ValidationException("邮箱已被注册")
-
-    user = User.objects.create_user(username=username, email=email, password=password)
+    # 由数据库唯一约束判重，省去两次 exists() 并避免并发注册竞态
+    try:
+        with transaction.atomic():
+            user = User.objects.create_user(username=username, email=email, password=password)
+    except IntegrityError as exc:
+        raise ValidationException(_duplicate_user_message(exc, "邮箱已被注册"))
 
     profile = getattr(user, "profile", None)
     if profile:
+        changed = []
         if nickname:
             profile.nickname = nickname
+            changed.append("nickname")
         if gender:
             profile.gender = gender
+            changed.append("gender")
         if birth_date:
             try:
                 birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d").date()
                 profile.birth_date = birth_date_obj
             except ValueError:
                 raise ValidationException("出生日期格式不正确，请使用 YYYY-MM-DD 格式")
+            changed.append("birth_date")
         if phone:
             profile.phone = phone
-        profile.save()
+            changed.append("phone")
+        if changed:
+            profile.save(update_fields=[*changed, "updated_at"])
 
-    UserActivity.objects.create(
-        user=user,
-        activity_type="register",
-        description=f"用户 {user.username} 注册成功",
-        ip_address=request.META.get("REMOTE_ADDR", ""),
-        user_agent=request.META.get("HTTP_USER_AGENT", ""),
-    )
+    _record_activity(request, user, "register", f"用户 {user.username} 注册成功")
 
     log_auth_action(
         action="用户注册",
@@ -135,19 +194,14 @@ def register_user(
         extra_data={"username": user.username, "email": user.email},
     )
 
+    clear_dashboard_cache()
     return serialize_user(user)
 
 
 def logout_user(request):
     ensure_authenticated(request.user)
 
-    UserActivity.objects.create(
-        user=request.user,
-        activity_type="logout",
-        description=f"用户 {request.user.username} 登出",
-        ip_address=request.META.get("REMOTE_ADDR", ""),
-        user_agent=request.META.get("HTTP_USER_AGENT", ""),
-    )
+    _record_activity(request, request.user, "logout", f"用户 {request.user.username} 登出")
 
     log_auth_action(
         action="用户登出",
@@ -161,6 +215,17 @@ def logout_user(request):
 
 
 # ====== 个人中心 ======
+def issue_captcha() -> Dict[str, Any]:
+    """每次生成一条新验证码：同一 key 只发给一个客户端，有效期按实际过期时间返回。"""
+    challenge, response = captcha_settings.get_challenge()()
+    store = CaptchaStore.objects.create(challenge=challenge, response=response)
+    return {
+        "captcha_key": store.hashkey,
+        "captcha_image_url": captcha_image_url(store.hashkey),
+        "expires_in": max(int((store.expiration - timezone.now()).total_seconds()), 0),
+    }
+
+
 def get_profile(user) -> Dict[str, Any]:
     ensure_authenticated(user)
     return serialize_user(user)
@@ -208,13 +273,7 @@ def change_password(
     user.set_password(new_password)
     user.save(update_fields=["password", "updated_at"])
 
-    UserActivity.objects.create(
-        user=user,
-        activity_type="password_change",
-        description=f"用户 {user.username} 修改了密码",
-        ip_address=request.META.get("REMOTE_ADDR", ""),
-        user_agent=request.META.get("HTTP_USER_AGENT", ""),
-    )
+    _record_activity(request, user, "password_change", f"用户 {user.username} 修改了密码")
 
     log_user_action(
         action="修改密码",
@@ -254,19 +313,26 @@ def update_profile(user, *, nickname: Optional[str], gender: Optional[str], birt
     if not profile:
         raise NotFoundException("用户资料不存在")
 
+    # 只更新实际修改的列
+    changed = []
     if nickname:
         if is_nickname_taken(nickname.strip(), exclude_user_id=user.id):
             raise ValidationException("昵称已被其他用户使用，请选择其他昵称")
         profile.nickname = nickname.strip()
+        changed.append("nickname")
 
     if gender:
         profile.gender = gender
+        changed.append("gender")
     if birth_date:
         profile.birth_date = birth_date
+        changed.append("birth_date")
     if phone:
         profile.phone = phone
+        changed.append("phone")
 
-    profile.save()
+    if changed:
+        profile.save(update_fields=[*changed, "updated_at"])
 
     log_user_action(
         action="更新资料",
@@ -276,26 +342,38 @@ def update_profile(user, *, nickname: Optional[str], gender: Optional[str], birt
     )
 
 
-def list_user_activities(user, page: int = 1, page_size: int = 10, activity_type: Optional[str] = None) -> Dict[str, Any]:
+def _serialize_activity(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "activity_type": ACTIVITY_LABELS.get(row["activity_type"], row["activity_type"]),
+        "description": row["description"],
+        "ip_address": row["ip_address"],
+        "created_at": row["created_at"],
+    }
+
+
+def list_user_activities(
+    user,
+    page: int = 1,
+    page_size: int = 10,
+    activity_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """活动记录列表；传入 cursor（首页为空串）时使用游标分页，不统计总数。"""
     ensure_authenticated(user)
 
     activities_qs = get_user_activities(user, activity_type=activity_type)
-    page_objects, total_count, total_pages = paginate_queryset(activities_qs, page, page_size)
-
-    activities_data = []
-    for activity in page_objects:
-        activities_data.append(
-            {
-                "id": activity.id,
-                "activity_type": activity.get_activity_type_display(),
-                "description": activity.description,
-                "ip_address": activity.ip_address,
-                "created_at": to_iso(activity.created_at),
-            }
-        )
+    if cursor is not None:
+        page_objects, next_cursor = keyset_paginate(activities_qs, cursor, page_size)
+        return {
+            "activities": [_serialize_activity(row) for row in page_objects],
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
 
+    page_objects, total_count, total_pages = paginate_queryset(activities_qs, page, page_size)
     return {
-        "activities": activities_data,
+        "activities": [_serialize_activity(row) for row in page_objects],
         "page": page,
         "page_size": page_size,
         "total": total_count,
@@ -304,30 +382,41 @@ def list_user_activities(user, page: int = 1, page_size: int = 10, activity_type
 
 
 # ====== 管理 ======
-def list_users(user, page: int = 1, page_size: int = 10, search: Optional[str] = None) -> Dict[str, Any]:
+def _serialize_user_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "username": row["username"],
+        "email": row["email"],
+        "is_active": row["is_active"],
+        "is_staff": row["is_staff"],
+        "date_joined": row["date_joined"],
+        "nickname": row["profile__nickname"],
+        "login_count": row["profile__login_count"] or 0,
+    }
+
+
+def list_users(
+    user,
+    page: int = 1,
+    page_size: int = 10,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """用户列表；传入 cursor（首页为空串）时使用游标分页，不统计总数。"""
     ensure_staff_or_superuser(user)
 
     queryset = filter_users(search)
-    page_objects, total_count, total_pages = paginate_queryset(queryset, page, page_size)
-
-    users_data = []
-    for item in page_objects:
-        profile = getattr(item, "profile", None)
-        users_data.append(
-            {
-                "id": item.id,
-                "username": item.username,
-                "email": item.email,
-                "is_active": item.is_active,
-                "is_staff": item.is_staff,
-                "date_joined": to_iso(getattr(item, "date_joined", None)),
-                "nickname": getattr(profile, "nickname", None),
-                "login_count": getattr(profile, "login_count", 0),
-            }
-        )
+    if cursor is not None:
+        page_objects, next_cursor = keyset_paginate(queryset, cursor, page_size)
+        return {
+            "users": [_serialize_user_row(row) for row in page_objects],
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
 
+    page_objects, total_count, total_pages = paginate_queryset(queryset, page, page_size)
     return {
-        "users": users_data,
+        "users": [_serialize_user_row(row) for row in page_objects],
         "total": total_count,
         "page": page,
         "page_size": page_size,
@@ -335,6 +424,13 @@ def list_users(user, page: int = 1, page_size: int = 10, search: Optional[str] =
     }
 
 
+def iter_users(user, search: Optional[str] = None, chunk_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """流式导出用户列表：权限在调用时即校验，数据按块读取、逐行序列化。"""
+    ensure_staff_or_superuser(user)
+    rows = filter_users(search).iterator(chunk_size=chunk_size)
+    return (_serialize_user_row(row) for row in rows)
+
+
 def create_user_admin(
     user,
     *,
@@ -347,12 +443,11 @@ def create_user_admin(
 ) -> Dict[str, Any]:
     ensure_staff_or_superuser(user)
 
-    if check_user_exists_by_username(username):
-        raise ValidationException("用户名已存在")
-    if check_user_exists_by_email(email):
-        raise ValidationException("邮箱已被使用")
-
-    new_user = User.objects.create_user(username=username, email=email, password=password)
+    try:
+        with transaction.atomic():
+            new_user = User.objects.create_user(username=username, email=email, password=password)
+    except IntegrityError as exc:
+        raise ValidationException(_duplicate_user_message(exc, "邮箱已被使用"))
     new_user.is_staff = is_staff
     new_user.is_active = is_active
     new_user.save(update_fields=["is_staff", "is_active", "updated_at"])
@@ -370,6 +465,7 @@ def create_user_admin(
         extra_data={"new_user_id": new_user.id, "username": username},
     )
 
+    clear_dashboard_cache()
     return {"user_id": new_user.id, "username": new_user.username}
 
 
@@ -385,6 +481,7 @@ def toggle_user_status(user, target_user_id: UUID) -> Dict[str, Any]:
 
     target.is_active = not target.is_active
     target.save(update_fields=["is_active", "updated_at"])
+    clear_dashboard_cache()
 
     log_admin_action(
         action="切换用户状态",
@@ -413,16 +510,31 @@ def update_user_admin(user, target_user_id: UUID, *, email: Optional[str] = None
     if not target:
         raise NotFoundException("用户不存在")
 
+    changed = []
     if email:
         target.email = email
+        changed.append("email")
     if is_staff is not None:
         target.is_staff = is_staff
-    target.save()
+        changed.append("is_staff")
+    if not changed:
+        return
+    try:
+        with transaction.atomic():
+            target.save(update_fields=[*changed, "updated_at"])
+    except IntegrityError:
+        raise ValidationException("邮箱已被使用")
+    clear_dashboard_cache()
 
 
 def get_dashboard_data(user) -> Dict[str, Any]:
     ensure_staff_or_superuser(user)
-    return get_admin_dashboard_metrics()
+    cached = get_dashboard_from_cache()
+    if cached is not None:
+        return cached
+    data = get_admin_dashboard_metrics()
+    set_dashboard_to_cache(data)
+    return data
 
 
 def get_dashboard_chart_data(user, days: int = 30) -> Dict[str, Any]:
@@ -442,6 +554,7 @@ def delete_user_admin(user, target_user_id: UUID):
 
     username = target.username
     target.soft_delete()
+    clear_dashboard_cache()
 
     log_admin_action(
         action="删除用户",
@@ -453,20 +566,33 @@ def delete_user_admin(user, target_user_id: UUID):
 
 
 # ====== 数据工厂 ======
-def _generate_unique_username(faker_obj) -> str:
-    for _ in range(5):
-        candidate = faker_obj.user_name()
-        if not check_user_exists_by_username(candidate):
-            return candidate
-    return f"user_{uuid4().hex[:8]}"
-
-
-def _generate_unique_email(faker_obj) -> str:
-    for _ in range(5):
-        candidate = faker_obj.email()
-        if not check_user_exists_by_email(candidate):
-            return candidate
-    return f"user_{uuid4().hex[:8]}@example.com"
+def clear_duplicate_active_emails() -> Dict[str, List[str]]:
+    """重复邮箱保留给最早注册的账号，其余未删除账号的邮箱置空；返回 邮箱 -> 被置空的用户名。"""
+    cleared: Dict[str, List[str]] = {}
+    with transaction.atomic():
+        for email, rows in get_duplicate_active_emails().items():
+            later = rows[1:]
+            User.objects.filter(id__in=[row["id"] for row in later]).update(email="")
+            cleared[email] = [row["username"] for row in later]
+    return cleared
+
+
+def _pick_available(candidates: List[str], taken: set, count: int, fallback) -> List[str]:
+    """从候选中挑出未被占用的值，不足部分用随机值补齐。"""
+    values = [candidate for candidate in candidates if candidate not in taken][:count]
+    while len(values) < count:
+        values.append(fallback())
+    return values
+
+
+def _generate_unique_credentials(faker_obj, count: int) -> Tuple[List[str], List[str]]:
+    """批量生成候选用户名与邮箱，一次查询剔除已占用的值。"""
+    username_candidates = list(dict.fromkeys(faker_obj.user_name() for _ in range(count * 2)))
+    email_candidates = list(dict.fromkeys(faker_obj.email() for _ in range(count * 2)))
+    taken_usernames, taken_emails = get_taken_usernames_and_emails(username_candidates, email_candidates)
+    usernames = _pick_available(username_candidates, taken_usernames, count, lambda: f"user_{uuid4().hex[:8]}")
+    emails = _pick_available(email_candidates, taken_emails, count, lambda: f"user_{uuid4().hex[:8]}@example.com")
+    return usernames, emails
 
 
 def seed_users_service(
@@ -490,11 +616,11 @@ def seed_users_service(
         if not target_role:
             raise NotFoundException("角色不存在或已禁用")
 
-    created_users = []
-    for _ in range(count):
-        username = _generate_unique_username(faker)
-        email = _generate_unique_email(faker)
+    usernames, emails = _generate_unique_credentials(faker, count)
 
+    created_users = []
+    new_roles = []
+    for username, email in zip(usernames, emails):
         new_user = User.objects.create_user(username=username, email=email, password=default_password)
         new_user.is_active = True
         new_user.save(update_fields=["is_active", "updated_at"])
@@ -506,7 +632,7 @@ def seed_users_service(
             profile.save(update_fields=["nickname", "phone", "updated_at"])
 
         if target_role:
-            UserRole.objects.get_or_create(user=new_user, role=target_role, defaults={"is_active": True})
+            new_roles.append(UserRole(user=new_user, role=target_role, is_active=True))
 
         created_users.append(
             {
@@ -517,6 +643,12 @@ def seed_users_service(
             }
         )
 
+    if new_roles:
+        # 新用户不可能已有角色关联，一次批量插入即可
+        UserRole.objects.bulk_create(new_roles, ignore_conflicts=True)
+
+    clear_dashboard_cache()
+
     log_admin_action(
         action="批量生成用户",
         message=f"管理员 {operator.username} 批量生成用户：{len(created_users)} 个",
@@ -540,12 +672,14 @@ __all__ = [
     "login_user",
     "register_user",
     "logout_user",
+    "issue_captcha",
     "get_profile",
     "change_password",
     "upload_avatar",
     "update_profile",
     "list_user_activities",
     "list_users",
+    "iter_users",
     "create_user_admin",
     "toggle_user_status",
     "get_user_detail",
@@ -554,4 +688,5 @@ __all__ = [
     "get_dashboard_chart_data",
     "delete_user_admin",
     "seed_users_service",
+    "clear_duplicate_active_emails",
 ]
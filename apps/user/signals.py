@@ -1,6 +1,7 @@
-"""用户模型信号：自动创建/保存资料。"""
+"""用户模型信号：自动创建资料。"""
 from __future__ import annotations
 
+import logging
 import random
 
 from django.contrib.auth import get_user_model
@@ -9,6 +10,8 @@ from django.dispatch import receiver
 
 from .model import UserProfile
 
+logger = logging.getLogger(__name__)
+
 
 def generate_nickname() -> str:
     """生成随机昵称：用户{随机五位数字}。"""
@@ -26,15 +29,6 @@ def create_user_profile(sender, instance, created, **kwargs):
         while UserProfile.objects.filter(nickname=nickname).exists():
             nickname = generate_nickname()
         UserProfile.objects.create(user=instance, nickname=nickname)
-    except Exception as exc:
-        print(f"创建用户资料失败: {exc}")
-
+    except Exception:
+        logger.exception("创建用户资料失败: user_id=%s", instance.pk)
 
-@receiver(post_save, sender=get_user_model())
-def save_user_profile(sender, instance, **kwargs):
-    """用户更新时自动保存用户资料。"""
-    if hasattr(instance, "profile"):
-        try:
-            instance.profile.save()
-        except Exception as exc:
-            print(f"保存用户资料失败: {exc}")
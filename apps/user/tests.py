@@ -0,0 +1,69 @@
+"""用户应用测试。"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.core.api.exceptions import ValidationException
+from apps.core.utils.pagination import decode_cursor, encode_cursor
+
+from .model import UserActivity
+from .services import list_user_activities
+
+User = get_user_model()
+
+
+class CursorCodecTests(SimpleTestCase):
+    def test_round_trip(self):
+        value, pk = timezone.now(), uuid4()
+        cursor = encode_cursor(value, pk)
+        self.assertEqual(decode_cursor(cursor), (value, pk))
+
+    def test_invalid_cursor_raises_validation_error(self):
+        with self.assertRaises(ValidationException):
+            decode_cursor("not-a-cursor")
+
+    def test_non_uuid_pk_is_rejected(self):
+        with self.assertRaises(ValidationException):
+            decode_cursor(encode_cursor(timezone.now(), "abc"))
+
+    def test_naive_datetime_is_rejected(self):
+        with self.assertRaises(ValidationException):
+            decode_cursor(encode_cursor(datetime(2026, 1, 1, 12, 0), uuid4()))
+
+
+class ActivityCursorPaginationTests(TestCase):
+    """活动列表游标分页：逐页遍历不重不漏，按 (created_at, id) 倒序。"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", email="alice@example.com", password="pw")
+        base = timezone.now()
+        # 后两条时间相同，依赖 id 作为次序键
+        times = [base - timedelta(minutes=m) for m in (0, 1, 2, 3, 3)]
+        UserActivity.objects.bulk_create(
+            UserActivity(user=cls.user, activity_type="login", description=f"#{i}", created_at=created_at)
+            for i, created_at in enumerate(times)
+        )
+
+    def test_walks_all_pages_in_order(self):
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            data = list_user_activities(self.user, page_size=2, cursor=cursor)
+            self.assertLessEqual(len(data["activities"]), 2)
+            self.assertNotIn("total", data)
+            seen.extend(data["activities"])
+            cursor = data["next_cursor"]
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len({row["id"] for row in seen}), 5)
+        keys = [(row["created_at"], str(row["id"])) for row in seen]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+    def test_page_number_mode_still_reports_totals(self):
+        data = list_user_activities(self.user, page=1, page_size=2)
+        self.assertEqual(data["total"], 5)
+        self.assertEqual(data["total_pages"], 3)
@@ -9,7 +9,7 @@ from apps.notification.api import NotificationController
 from apps.setting.api import create_setting_api_router
 from apps.log.api import LogController
 from apps.core.api.exceptions import APIException
-from apps.core.api.responses import ApiResponse
+from apps.core.api.responses import ApiResponse, ORJSONRenderer
 
 # 单实例 API，对外暴露给 Django URLConf
 api = NinjaExtraAPI(
@@ -18,6 +18,7 @@ api = NinjaExtraAPI(
     version="1.0.0",
     docs_url="/docs/",
     openapi_url="/openapi.json",
+    renderer=ORJSONRenderer(),
 )
 
 # 注册各 App Router（统一入口，便于未来分组/前缀调整）
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -108,6 +109,58 @@ DATABASES = {
 }
 
 
+# Cache
+# 配置 REDIS_URL（如 redis://127.0.0.1:6379/0 或 unix:///run/redis/redis.sock）时使用 Redis，
+# 多进程部署需共享缓存以保证失效及时；未配置时退回进程内缓存
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Session
+# 有共享的 Redis 缓存时，会话读取优先走缓存，未命中再回源数据库；写入同时落库保证持久。
+# 进程内缓存无法跨进程失效（登出后其他 worker 仍可能读到旧会话），此时只用数据库
+
+if REDIS_URL:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+    SESSION_CACHE_ALIAS = 'default'
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+
+
+# 审计类数据（用户活动等）由后台线程批量写入；可用环境变量 BACKGROUND_WRITES_ENABLED=false 关闭，测试时自动关闭
+BACKGROUND_WRITES_ENABLED = os.environ.get('BACKGROUND_WRITES_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+
+
+# 密码哈希：bcrypt（默认 12 轮，单次校验约 250ms）替代 72 万次迭代的 PBKDF2，
+# 旧哈希在用户下次登录时自动升级为首选算法
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# 运行测试（manage.py test 或 pytest）时使用廉价的 MD5 哈希，并让审计数据同步落库便于断言
+TESTING = (len(sys.argv) > 1 and sys.argv[1] == 'test') or 'pytest' in sys.modules
+if TESTING:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+    BACKGROUND_WRITES_ENABLED = False
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -162,6 +215,10 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:8000",
     "http://127.0.0.1:8000",
 ]
+# 仅对 API 路径处理跨域，页面/静态资源请求直接跳过 CORS 逻辑
+CORS_URLS_REGEX = r"^/api/.*$"
+# 预检结果缓存 24 小时
+CORS_PREFLIGHT_MAX_AGE = 86400
 
 # Ninja API设置
 NINJA_PAGINATION_PER_PAGE = 20
@@ -171,9 +228,8 @@ NINJA_PAGINATION_MAX_PER_PAGE = 100
 # Django Allauth 设置
 # ==================
 AUTHENTICATION_BACKENDS = (
-    'django.contrib.auth.backends.ModelBackend',
+    'apps.user.backends.ProfileModelBackend',  # ModelBackend + 资料 JOIN
     'allauth.account.auth_backends.AuthenticationBackend',  # Allauth 后端
-    'guardian.backends.ObjectPermissionBackend',  # Guardian 后端
 )
 
 # Allauth 设置
@@ -224,3 +280,30 @@ CAPTCHA_URL_PREFIX = 'captcha/'
 # ==================
 # 允许同源iframe嵌入（用于API文档页面）
 X_FRAME_OPTIONS = 'SAMEORIGIN'
+
+# ==================
+# 日志设置
+# ==================
+# apps.* 日志经队列由后台线程输出，错误路径不在请求线程上写 stdout
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '%(asctime)s %(levelname)s %(name)s: %(message)s',
+        },
+    },
+    'handlers': {
+        'async_console': {
+            'class': 'apps.core.utils.log_handlers.AsyncStreamHandler',
+            'formatter': 'verbose',
+        },
+    },
+    'loggers': {
+        'apps': {
+            'handlers': ['async_console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}